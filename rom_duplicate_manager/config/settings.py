@@ -1,29 +1,79 @@
 """Configuration management for ROM Duplicate Manager."""
 
 import configparser
+import json
 import os
 from typing import Dict, Any
 
 # Configuration file name
-CONFIG_FILE = 'rom_duplicate_manager.ini'
+CONFIG_FILE = 'rom_duplicate_manager.json'
 
+# Previous INI configuration file, read once if no JSON file exists yet
+LEGACY_CONFIG_FILE = 'rom_duplicate_manager.ini'
 
-def load_config() -> configparser.ConfigParser:
-    """Load application configuration from INI file.
+# Settings stored as booleans (used to convert legacy INI values)
+_BOOL_SETTINGS = (
+    'dark_mode', 'row_colors', 'alternate_colors', 'smart_select', 'scan_images',
+    'match_size', 'permanent_delete', 'use_regex', 'search_in_path'
+)
+
+def _load_legacy_config() -> Dict[str, Any]:
+    """Load settings from the old INI configuration file.
 
     Returns:
-        ConfigParser object with loaded settings or empty if file doesn't exist
+        Dictionary of settings, or empty if the file is missing or unreadable
     """
     config = configparser.ConfigParser()
+    try:
+        config.read(LEGACY_CONFIG_FILE)
+    except configparser.Error:
+        return {}
+    if not config.has_section('Settings'):
+        return {}
+
+    settings: Dict[str, Any] = {}
+    # The INI file never used interpolation, and values such as regex filters
+    # or paths may contain '%'
+    for key, value in config.items('Settings', raw=True):
+        if key in _BOOL_SETTINGS:
+            try:
+                settings[key] = config.getboolean('Settings', key, raw=True)
+            except ValueError:
+                pass
+        else:
+            settings[key] = value
+    return settings
+
+
+def load_config() -> Dict[str, Any]:
+    """Load application configuration from the JSON settings file.
+
+    Falls back to the legacy INI file on first launch after upgrading.
+
+    Returns:
+        Dictionary of saved settings, or empty if none exist
+    """
+    settings: Dict[str, Any] = {}
     if os.path.exists(CONFIG_FILE):
-        config.read(CONFIG_FILE)
-    return config
+        try:
+            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+            if isinstance(loaded, dict):
+                settings = loaded
+        except (OSError, ValueError):
+            pass
+    elif os.path.exists(LEGACY_CONFIG_FILE):
+        settings = _load_legacy_config()
+    return settings
 
 
 def save_config(dark_mode: bool, row_colors: bool, language: str, smart_select: bool,
                 scan_images: bool, match_size: bool, permanent_delete: bool,
                 use_regex: bool, file_type: str, search_in_path: bool, theme: str = 'darkly') -> None:
-    """Save application configuration to INI file.
+    """Save application configuration to the JSON settings file.
+
+    The file is written to a temporary path and then atomically moved into
+    place, so an interrupted save never leaves a truncated file.
 
     Args:
         dark_mode: Whether dark mode is enabled
@@ -38,22 +88,23 @@ def save_config(dark_mode: bool, row_colors: bool, language: str, smart_select:
         search_in_path: Whether to search in full file paths
         theme: Current ttkbootstrap theme name
     """
-    config = configparser.ConfigParser()
-    config['Settings'] = {
-        'dark_mode': str(dark_mode),
-        'row_colors': str(row_colors),
+    settings = {
+        'dark_mode': bool(dark_mode),
+        'row_colors': bool(row_colors),
         'language': str(language),
-        'smart_select': str(smart_select),
-        'scan_images': str(scan_images),
-        'match_size': str(match_size),
-        'permanent_delete': str(permanent_delete),
-        'use_regex': str(use_regex),
+        'smart_select': bool(smart_select),
+        'scan_images': bool(scan_images),
+        'match_size': bool(match_size),
+        'permanent_delete': bool(permanent_delete),
+        'use_regex': bool(use_regex),
         'file_type': str(file_type),
-        'search_in_path': str(search_in_path),
+        'search_in_path': bool(search_in_path),
         'theme': str(theme)
     }
-    with open(CONFIG_FILE, 'w') as f:
-        config.write(f)
+    tmp_file = CONFIG_FILE + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(settings, f, indent=2)
+    os.replace(tmp_file, CONFIG_FILE)
 
 
 def get_default_config() -> Dict[str, Any]:
@@ -8,6 +8,13 @@ import re
 from typing import List, Tuple
 from rom_duplicate_manager.utils.helpers import extract_languages, extract_version
 
+# Prototype/demo/sample/beta releases rank below finished ones
+_LOW_PRIORITY_RE = re.compile(r'\(proto|\(demo|\(sample|\(beta')
+
+# Language preferences grouped by the video standard their regions use
+_NTSC_REGIONS = frozenset({'English-US', 'Japanese', 'Korean', 'Chinese'})
+_PAL_REGIONS = frozenset({'English-EU', 'French', 'German', 'Spanish', 'Italian', 'Dutch', 'Portuguese', 'Swedish'})
+
 
 class DuplicateLogicMixin:
     """Mixin class providing duplicate detection and smart selection logic."""
@@ -23,6 +30,11 @@ class DuplicateLogicMixin:
         - Video format compatibility
         - File name length (shorter names preferred)
 
+        Results are cached per path until the language preference or root
+        folder changes (or a new scan completes). The parsed filename details
+        (languages, version, quality) don't depend on either setting, so they
+        are kept separately and survive those changes.
+
         Args:
             filepath: Full path to the file to evaluate
 
@@ -30,20 +42,33 @@ class DuplicateLogicMixin:
             Tuple for comparison where lower values = higher priority
         """
         lang_pref = self.language_filter.get()
-        filename = os.path.basename(filepath)
-        filename_lower = filename.lower()
+        folder = self.folder.get()
+        if self._priority_context != (lang_pref, folder):
+            self._priority_cache = {}
+            self._priority_context = (lang_pref, folder)
+            self._priority_root = folder.replace('\\', '/')
+        cached = self._priority_cache.get(filepath)
+        if cached is not None:
+            return cached
+
+        traits = self._file_traits.get(filepath)
+        if traits is None:
+            filename = os.path.basename(filepath)
+            languages = extract_languages(filename)
+            traits = (
+                os.path.dirname(filepath.replace('\\', '/')),
+                filename,
+                # Quality indicators (lower is worse)
+                1 if _LOW_PRIORITY_RE.search(filename.lower()) else 0,
+                languages,
+                len(languages - {'Unknown'}),
+                extract_version(filename),
+            )
+            self._file_traits[filepath] = traits
+        directory, filename, is_low_priority, languages, num_langs, version = traits
 
         # Location priority (root folder preferred)
-        root_folder = self.folder.get().replace('\\', '/')
-        is_not_in_root = 0 if os.path.dirname(filepath.replace('\\', '/')) == root_folder else 1
-
-        # Quality indicators (lower is worse)
-        is_low_priority = 1 if re.search(r'\(proto|\(demo|\(sample|\(beta', filename_lower) else 0
-
-        languages = extract_languages(filename)
-        actual_langs = languages - {'Unknown'}
-        num_langs = len(actual_langs)
-        version = extract_version(filename)
+        is_not_in_root = 0 if directory == self._priority_root else 1
         length = len(filename)
         is_world = 1 if 'World' in languages else 0
         has_lang = 1 if (lang_pref != 'Any' and lang_pref in languages) else 0
@@ -51,16 +76,14 @@ class DuplicateLogicMixin:
         # Video format priority based on language preference
         format_priority = 0
         if lang_pref != 'Any':
-            ntsc_regions = ('English-US', 'Japanese', 'Korean', 'Chinese')
-            pal_regions = ('English-EU', 'French', 'German', 'Spanish', 'Italian', 'Dutch', 'Portuguese', 'Swedish')
-            if lang_pref in ntsc_regions:
+            if lang_pref in _NTSC_REGIONS:
                 if 'NTSC' in languages:
                     format_priority = 2
                 elif 'PAL' in languages:
                     format_priority = 1
                 elif 'SECAM' in languages:
                     format_priority = -1
-            elif lang_pref in pal_regions:
+            elif lang_pref in _PAL_REGIONS:
                 if 'PAL' in languages:
                     format_priority = 2
                 elif 'SECAM' in languages:
@@ -68,9 +91,11 @@ class DuplicateLogicMixin:
                 elif 'NTSC' in languages:
                     format_priority = -1
 
-        # Return priority tuple (lower values = higher priority)
-        return (is_not_in_root, is_low_priority) + tuple(-v for v in version) + \
-               (-is_world, -has_lang, -format_priority, -num_langs, length, filename)
+        # Priority tuple (lower values = higher priority)
+        priority = (is_not_in_root, is_low_priority) + tuple(-v for v in version) + \
+                   (-is_world, -has_lang, -format_priority, -num_langs, length, filename)
+        self._priority_cache[filepath] = priority
+        return priority
 
     def get_base_file(self, files: List[str]) -> str:
         """Select the best file from a group of duplicates.
@@ -92,29 +117,43 @@ class DuplicateLogicMixin:
         For each group of duplicates, identifies the best file using priority
         ranking and marks others for removal if smart select is enabled.
         """
-        for parent in self.tree.get_children():
-            parent_text = self.tree.item(parent, 'text')
+        smart_select = self.smart_select.get()
+        # With smart select off the only work is clearing automatic marks,
+        # so there is nothing to do unless some exist
+        if not smart_select and not any(
+                ('base' in tags or 'to_remove' in tags) and 'manual' not in tags
+                for tags in self._item_tags.values()):
+            groups = {}
+        else:
+            groups = self._group_children
+
+        for parent, children in groups.items():
+            parent_text = self._group_info[parent][0]
             if parent_text in self.duplicates:
-                files = self.duplicates[parent_text]
-                base_file = self.get_base_file(files)
+                # Groups marked entirely by hand are left as they are
+                if all('manual' in self._item_tags.get(child, ()) for child in children):
+                    continue
+                base_file = self.get_base_file(self.duplicates[parent_text]) if smart_select else None
 
-                for child in self.tree.get_children(parent):
-                    current_tags = list(self.tree.item(child, 'tags'))
+                for child in children:
+                    old_tags = self._item_tags.get(child, ())
                     # Skip manually marked items
-                    if 'manual' in current_tags:
+                    if 'manual' in old_tags:
                         continue
 
-                    child_path = self.tree.item(child, 'values')[0]
-                    current_tags = [t for t in current_tags if t not in ('base', 'to_remove')]
+                    current_tags = [t for t in old_tags if t not in ('base', 'to_remove')]
 
-                    if self.smart_select.get():
+                    if smart_select:
+                        child_path = self._item_paths[child]
                         if child_path == base_file:
                             current_tags.append('base')
                         else:
                             current_tags.append('to_remove')
 
-                    self.tree.item(child, tags=tuple(current_tags))
+                    # Only write back rows whose tags actually change
+                    new_tags = tuple(current_tags)
+                    if new_tags != old_tags:
+                        self._set_item_tags(child, new_tags)
 
-        self.update_tag_colors()
         self.update_status_label()
         self.apply_filter()
@@ -0,0 +1,139 @@
+"""Persistent partial-hash cache for size-based duplicate detection."""
+
+import sqlite3
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..utils.helpers import PARTIAL_HASH_SCHEME
+
+# Cache database file name
+CACHE_FILE = 'rom_duplicate_manager.cache.db'
+
+
+class HashCache:
+    """Cache of partial file hashes keyed by path, modification time and size.
+
+    Only entries under the scanned folder are loaded into memory when the
+    cache is opened, and new hashes are written back in a single batch on
+    flush. After a completed scan, prune() deletes the loaded entries that the
+    scan no longer looked up, so rows for deleted or moved files don't pile up. A cached hash is only returned
+    when both the modification time and the size still match, so edited files
+    are rehashed automatically. Any database error disables the cache instead
+    of interrupting the scan.
+    """
+
+    def __init__(self, root: str, recursive: bool = True, db_path: str = CACHE_FILE) -> None:
+        """Open the cache database and load the entries under a folder.
+
+        Args:
+            root: Scanned folder prefix, ending with '/' (as used in cached paths)
+            recursive: Whether entries in subfolders of root are loaded too
+            db_path: Path to the SQLite cache file
+        """
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+        self._seen: Set[str] = set()
+        self._pending: List[Tuple[str, int, int, str]] = []
+        self._conn: Optional[sqlite3.Connection] = None
+
+        try:
+            self._conn = sqlite3.connect(db_path)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS hashes '
+                '(path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, phash TEXT)')
+
+            # Drop all entries if they were produced by a different hash scheme
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'scheme'").fetchone()
+            if row is None or row[0] != PARTIAL_HASH_SCHEME:
+                with self._conn:
+                    self._conn.execute('DELETE FROM hashes')
+                    self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('scheme', ?)",
+                                       (PARTIAL_HASH_SCHEME,))
+
+            # Paths starting with root sort between root and root with its
+            # trailing '/' replaced by the next character, '0'
+            prefix_len = len(root)
+            for path, mtime, size, phash in self._conn.execute(
+                    'SELECT path, mtime, size, phash FROM hashes WHERE path >= ? AND path < ?',
+                    (root, root[:-1] + '0')):
+                if recursive or '/' not in path[prefix_len:]:
+                    self._entries[path] = (mtime, size, phash)
+        except sqlite3.Error:
+            self.close()
+
+    def get(self, path: str, mtime: int, size: int) -> Optional[str]:
+        """Get a cached hash if the file hasn't changed since it was hashed.
+
+        Args:
+            path: File path
+            mtime: Current modification time in nanoseconds
+            size: Current file size in bytes
+
+        Returns:
+            Cached hash string, or None if missing or stale
+        """
+        self._seen.add(path)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == mtime and entry[1] == size:
+            return entry[2]
+        return None
+
+    def put(self, path: str, mtime: int, size: int, phash: str) -> None:
+        """Record a freshly computed hash (written to disk on flush).
+
+        Args:
+            path: File path
+            mtime: Modification time in nanoseconds
+            size: File size in bytes
+            phash: Partial hash of the file
+        """
+        self._seen.add(path)
+        self._entries[path] = (mtime, size, phash)
+        self._pending.append((path, mtime, size, phash))
+
+    def prune(self) -> None:
+        """Delete loaded entries that weren't looked up since the cache was opened.
+
+        Call only after a completed scan, when every file that still needs a
+        hash has been passed to get().
+        """
+        stale = [(path,) for path in self._entries if path not in self._seen]
+        if self._conn is None or not stale:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany('DELETE FROM hashes WHERE path = ?', stale)
+        except sqlite3.Error:
+            pass  # Cache is best-effort; stale rows are retried on the next scan
+        for (path,) in stale:
+            del self._entries[path]
+
+    def flush(self) -> None:
+        """Write all pending entries to the database in one batch."""
+        if self._conn is None or not self._pending:
+            self._pending.clear()
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO hashes (path, mtime, size, phash) VALUES (?, ?, ?, ?)',
+                    self._pending)
+        except sqlite3.Error:
+            pass  # Cache is best-effort; hashes are simply recomputed next time
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush pending entries and close the database connection."""
+        if self._conn is not None:
+            self.flush()
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def __enter__(self) -> 'HashCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,13 +1,24 @@
 """Core scanning and duplicate detection functionality with async support."""
 
 import os
+import sys
 import threading
 import queue
-from typing import Dict, List, Set, Tuple, Optional, Callable, Any
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Set, Tuple, Optional, Callable, Any
 from dataclasses import dataclass
 from enum import Enum
 
 from ..utils.helpers import normalize_filename, get_partial_hash
+from .hash_cache import HashCache
+
+# Upper bound on concurrent partial-hash workers (hashlib releases the GIL)
+MAX_HASH_WORKERS = 8
+
+# System/metadata folders never descended into during recursive scans
+# (hidden folders starting with '.' are skipped as well)
+_SKIP_DIRS = frozenset({'__macosx', 'system volume information', '$recycle.bin'})
 
 
 class ScanStatus(Enum):
@@ -156,6 +167,120 @@ class AsyncScanner:
             ))
 
 
+def _lower_ext(name: str) -> str:
+    """Get the lowercased extension of a bare file name.
+
+    Equivalent to os.path.splitext(name)[1].lower() (leading dots do not start
+    an extension) without the generic path handling.
+
+    Args:
+        name: File name without directory components
+
+    Returns:
+        Extension including the dot, or an empty string
+    """
+    stem = name.lstrip('.')
+    i = stem.rfind('.')
+    return stem[i:].lower() if i > 0 else ''
+
+
+def _make_ext_filter(extension_filter: Optional[Set[str]],
+                     exclude_extensions: Optional[Set[str]]) -> Callable[[str], bool]:
+    """Resolve the include/exclude extension policy into a single predicate.
+
+    Args:
+        extension_filter: Set of file extensions to include (None = all files)
+        exclude_extensions: Set of file extensions to skip when extension_filter is None
+
+    Returns:
+        Function taking a lowercased extension and returning True to include it
+    """
+    # Extensions are compared lowercased, so the sets are lowercased once here
+    if extension_filter:
+        return frozenset(ext.lower() for ext in extension_filter).__contains__
+    if exclude_extensions:
+        excluded = frozenset(ext.lower() for ext in exclude_extensions)
+        return lambda ext: ext not in excluded
+    return lambda ext: True
+
+
+def _iter_files(folder: str, recursive: bool) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Yield regular file entries in a folder using os.scandir.
+
+    Directories are visited depth-first in the same order as os.walk, but the
+    DirEntry objects are kept so their cached type and stat data can be reused.
+    Unreadable directories are skipped, and hidden or system folders (see
+    _SKIP_DIRS) are pruned instead of being walked and filtered afterwards.
+
+    Args:
+        folder: Directory path to scan
+        recursive: Whether to descend into subdirectories
+
+    Yields:
+        Tuple of (directory prefix, DirEntry) for each regular file (symlinks are
+        not followed). The prefix ends with a separator, is the same object for
+        every file in a directory, and prefix + entry.name equals entry.path.
+    """
+    stack = [folder]
+    while stack:
+        directory = stack.pop()
+        prefix = os.path.join(directory, '')
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            name = entry.name
+                            if recursive and not name.startswith('.') and name.lower() not in _SKIP_DIRS:
+                                subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield prefix, entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _group_by_name(groups: Dict[str, List[str]], dirs: List[str], records: List[Tuple[int, str, str]],
+                   system_extensions: Optional[Set[str]], ignore_system_prefix: bool,
+                   progress_callback: Optional[Callable[[int, int, str], bool]],
+                   batch_size: int) -> bool:
+    """Group paths by normalized file name.
+
+    Files are processed in batches with progress reported once per batch, so
+    the inner loop only normalizes and appends. Kept free of dynamic features
+    so it can be compiled with mypyc if the pure-Python loop ever becomes the
+    bottleneck.
+
+    Args:
+        groups: Mapping to append paths to, keyed by normalized name
+        dirs: Directory prefixes (with trailing '/') referenced by records
+        records: (directory index, file name, lowercased extension) for each file
+        system_extensions: Optional set of ROM/system extensions for prefix stripping
+        ignore_system_prefix: Ignore 3-4 digit catalog prefixes on system ROMs
+        progress_callback: Optional callback returning False to cancel
+        batch_size: Number of files between progress updates
+
+    Returns:
+        False if the scan was cancelled, True otherwise
+    """
+    total = len(records)
+    normalize = normalize_filename
+    intern = sys.intern
+    for start in range(0, total, batch_size):
+        end = min(start + batch_size, total)
+        if progress_callback and not progress_callback(start + 1, total, f"Scanning: {records[start][1]}"):
+            return False
+        for dir_idx, name, _ in records[start:end]:
+            groups[intern(normalize(name, system_extensions, ignore_system_prefix))].append(dirs[dir_idx] + name)
+    if progress_callback and (total - 1) % batch_size != 0:
+        if not progress_callback(total, total, f"Scanning: {records[-1][1]}"):
+            return False
+    return True
+
+
 def _scan_folder_internal(folder: str, recursive: bool,
                           extension_filter: Optional[Set[str]],
                           match_size: bool,
@@ -167,35 +292,30 @@ def _scan_folder_internal(folder: str, recursive: bool,
 
     The progress_callback returns True to continue, False to cancel.
     """
-    file_list = []
-    if recursive:
-        for root, dirs, files in os.walk(folder):
-            for f in files:
-                _, ext = os.path.splitext(f)
-                ext_lower = ext.lower()
-                if extension_filter and ext_lower not in extension_filter:
-                    continue
-                if not extension_filter and exclude_extensions and ext_lower in exclude_extensions:
-                    continue
-                file_list.append(os.path.join(root, f).replace('\\', '/'))
-    else:
-        if os.path.exists(folder):
-            try:
-                with os.scandir(folder) as entries:
-                    for entry in entries:
-                        if entry.is_file(follow_symlinks=False):
-                            _, ext = os.path.splitext(entry.name)
-                            ext_lower = ext.lower()
-                            if extension_filter and ext_lower not in extension_filter:
-                                continue
-                            if not extension_filter and exclude_extensions and ext_lower in exclude_extensions:
-                                continue
-                            file_list.append(entry.path.replace('\\', '/'))
-            except PermissionError:
-                pass
-
-    groups = {}
-    total = len(file_list)
+    include = _make_ext_filter(extension_filter, exclude_extensions)
+
+    # Files are recorded as (directory index, name, lowercased extension) so
+    # each directory path is stored once and each extension is derived once;
+    # full paths are only built for the final groups. DirEntry objects are
+    # kept only when their stat data is needed.
+    dirs: List[str] = []
+    records: List[Tuple[int, str, str]] = []
+    entries: List[os.DirEntry] = []
+    last_prefix = None
+    for prefix, entry in _iter_files(folder, recursive):
+        name = entry.name
+        ext = _lower_ext(name)
+        if not include(ext):
+            continue
+        if prefix is not last_prefix:
+            dirs.append(prefix.replace('\\', '/'))
+            last_prefix = prefix
+        records.append((len(dirs) - 1, name, ext))
+        if match_size:
+            entries.append(entry)
+
+    groups = defaultdict(list)
+    total = len(records)
     if total == 0:
         return {}, {}
 
@@ -204,50 +324,98 @@ def _scan_folder_internal(folder: str, recursive: bool,
 
     if not match_size:
         # Name-based grouping
-        for i, full_path in enumerate(file_list):
-            if progress_callback and (i % batch_size == 0 or i == total - 1):
-                if not progress_callback(i + 1, total, f"Scanning: {os.path.basename(full_path)}"):
-                    return {}, {}  # Cancelled
-            base = normalize_filename(os.path.basename(full_path), system_extensions, ignore_system_prefix)
-            groups.setdefault(base, []).append(full_path)
+        if not _group_by_name(groups, dirs, records, system_extensions, ignore_system_prefix,
+                              progress_callback, batch_size):
+            return {}, {}  # Cancelled
     else:
-        # Size-based grouping with partial hashing
-        size_map = {}
-        for i, full_path in enumerate(file_list):
+        # Size-based grouping with partial hashing (files referenced by record index)
+        size_map = defaultdict(list)
+        mtimes = {}
+        for i, entry in enumerate(entries):
             if progress_callback and (i % batch_size == 0 or i == total - 1):
-                if not progress_callback(i + 1, total, f"Checking size: {os.path.basename(full_path)}"):
+                if not progress_callback(i + 1, total, f"Checking size: {entry.name}"):
                     return {}, {}  # Cancelled
             try:
-                size = os.path.getsize(full_path)
-                size_map.setdefault(size, []).append(full_path)
-            except Exception:
-                pass
-
-        hashed_count = 0
-        potential_dupes = [paths for paths in size_map.values() if len(paths) > 1]
-        total_to_hash = sum(len(p) for p in potential_dupes)
-
-        for size, paths in size_map.items():
-            if len(paths) == 1:
-                full_path = paths[0]
-                base = normalize_filename(os.path.basename(full_path), system_extensions, ignore_system_prefix)
-                groups.setdefault(base, []).append(full_path)
+                st = entry.stat(follow_symlinks=False)
+                mtimes[i] = st.st_mtime_ns
+                size_map[st.st_size].append(i)
+            except OSError:
+                pass  # Vanished or unreadable since the directory listing
+        del entries
+
+        def full_path(i: int) -> str:
+            dir_idx, name, _ = records[i]
+            return dirs[dir_idx] + name
+
+        # Size/hash keys include the extension, so a file that is the only
+        # one of its extension at its size can't share a key with another
+        # file and needn't be hashed
+        candidates = []
+        for size, indices in size_map.items():
+            if len(indices) > 1:
+                ext_counts = Counter(records[i][2] for i in indices)
+                for i in indices:
+                    if ext_counts[records[i][2]] > 1:
+                        candidates.append((i, full_path(i), size))
+
+        hashes = {}
+        if candidates:
+            root = os.path.join(folder, '').replace('\\', '/')
+            with HashCache(root, recursive) as hash_cache:
+                # Resolve cached hashes first so only new or changed files are read
+                to_hash = []
+                for i, path, size in candidates:
+                    h = hash_cache.get(path, mtimes[i], size)
+                    if h is None:
+                        to_hash.append((i, path, size))
+                    else:
+                        hashes[i] = h
+
+                # Hash the rest concurrently; results are consumed in submission
+                # order so progress reporting and cache writes stay on this thread
+                total_to_hash = len(to_hash)
+                if to_hash:
+                    workers = min(MAX_HASH_WORKERS, os.cpu_count() or 4, total_to_hash)
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [executor.submit(get_partial_hash, path, size) for _, path, size in to_hash]
+                        for hashed_count, ((i, path, size), future) in enumerate(zip(to_hash, futures), 1):
+                            # Report every 64 files (and the last one)
+                            if progress_callback and ((hashed_count & 63) == 1 or hashed_count == total_to_hash):
+                                if not progress_callback(hashed_count, total_to_hash, f"Hashing: {records[i][1]}"):
+                                    for pending in futures:
+                                        pending.cancel()
+                                    return {}, {}  # Cancelled
+                            h = future.result()
+                            if h:
+                                hashes[i] = h
+                                hash_cache.put(path, mtimes[i], size, h)
+
+                # Drop rows under this folder for files the scan no longer needs
+                hash_cache.prune()
+
+        for size, indices in size_map.items():
+            if len(indices) == 1:
+                i = indices[0]
+                base = sys.intern(normalize_filename(records[i][1], system_extensions, ignore_system_prefix))
+                groups[base].append(full_path(i))
             else:
-                for full_path in paths:
-                    hashed_count += 1
-                    if progress_callback:
-                        if not progress_callback(hashed_count, total_to_hash, f"Hashing: {os.path.basename(full_path)}"):
-                            return {}, {}  # Cancelled
-                    h = get_partial_hash(full_path)
-                    _, ext = os.path.splitext(full_path)
+                for i in indices:
+                    h = hashes.get(i)
+                    ext = records[i][2]
                     if h:
-                        base = f"Size: {size:,} bytes ({ext.lower()}) [Hash: {h[:8]}]"
+                        base = sys.intern(f"Size: {size:,} bytes ({ext}) [Hash: {h[:16]}]")
                     else:
-                        base = f"Size: {size:,} bytes ({ext.lower()})"
-                    groups.setdefault(base, []).append(full_path)
-
-    duplicates = {k: v for k, v in groups.items() if len(v) > 1}
-    non_duplicates = {k: v for k, v in groups.items() if len(v) == 1}
+                        base = sys.intern(f"Size: {size:,} bytes ({ext})")
+                    groups[base].append(full_path(i))
+
+    # Split groups into duplicates and unique files in one pass
+    duplicates = {}
+    non_duplicates = {}
+    for k, v in groups.items():
+        if len(v) > 1:
+            duplicates[k] = v
+        else:
+            non_duplicates[k] = v
 
     return duplicates, non_duplicates
 
@@ -287,6 +455,43 @@ def scan_folder(folder: str, recursive: bool = False, extension_filter: Optional
     )
 
 
+def build_image_index(images_folder: str, image_extensions: Set[str]) -> List[Tuple[str, str]]:
+    """List image files with the ROM name each one belongs to.
+
+    Args:
+        images_folder: Path to the images directory
+        image_extensions: Set of image file extensions to include
+
+    Returns:
+        List of (lowercased name without extension or "-image" suffix, full path)
+        tuples in directory order
+    """
+    index = []
+    if not image_extensions:
+        return index
+
+    try:
+        with os.scandir(images_folder) as it:
+            for entry in it:
+                name, ext = os.path.splitext(entry.name)
+                if ext.lower() not in image_extensions:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                match_name = name.lower()
+                # Handle "-image" suffix convention
+                if match_name.endswith("-image"):
+                    match_name = match_name[:-6]
+                index.append((match_name, entry.path))
+    except OSError:
+        pass  # Handle missing folders and permission errors gracefully
+
+    return index
+
+
 def find_orphaned_images(images_folder: str, keep_filenames: Set[str], file_types: Dict[str, Set[str]]) -> List[str]:
     """Find orphaned image files that don't correspond to any ROM files.
 
@@ -298,24 +503,7 @@ def find_orphaned_images(images_folder: str, keep_filenames: Set[str], file_type
     Returns:
         List of full paths to orphaned image files
     """
-    if not os.path.exists(images_folder):
-        return []
-
+    # Same listing the UI uses: one scandir pass with no per-file stat calls
     image_extensions = file_types.get("Images", set())
-    orphaned = []
-
-    try:
-        for f in os.listdir(images_folder):
-            full_path = os.path.join(images_folder, f)
-            if os.path.isfile(full_path):
-                name, ext = os.path.splitext(f)
-                if image_extensions and ext.lower() in image_extensions:
-                    match_name = name.lower()
-                    if match_name.endswith("-image"):
-                        match_name = match_name[:-6]
-                    if match_name not in keep_filenames:
-                        orphaned.append(full_path)
-    except OSError:
-        pass
-
-    return orphaned
\ No newline at end of file
+    return [path for match_name, path in build_image_index(images_folder, image_extensions)
+            if match_name not in keep_filenames]
@@ -19,23 +19,25 @@ License: See LICENSE file
 """
 
 import os
-import math
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox, font as tkfont
 import ttkbootstrap as ttk_bs
 from send2trash import send2trash
-import configparser
-from typing import Dict, List, Set, Tuple, Optional, Callable, Union, Any
+from typing import AbstractSet, Dict, FrozenSet, List, Set, Tuple, Optional, Callable, Union, Any
 
 # Import from modular structure (relative imports within package)
 from .config.settings import load_config, save_config, CONFIG_FILE
-from .config.defaults import DEFAULT_FILE_TYPES, DEFAULT_LANGUAGE_PRIORITIES
+from .config.defaults import (
+    DEFAULT_FILE_TYPES, DEFAULT_FILE_TYPE_NAMES, DEFAULT_LANGUAGE_OPTIONS, DEFAULT_LANGUAGE_PRIORITIES
+)
 from .utils.icons import get_icon_photo
 from .utils.helpers import (
     normalize_filename, extract_version, extract_languages, get_partial_hash, format_size
 )
 from .ui.components import ToolTip, AutoScrollbar, create_tooltip
-from .core.scanner import AsyncScanner, ScanStatus
+from .core.scanner import AsyncScanner, ScanStatus, build_image_index
 from .utils.updater import UpdateChecker, get_current_version
 
 # Import all mixins
@@ -45,6 +47,9 @@ from .ui.file_list import FileListMixin
 from .ui.dialogs import DialogMixin
 from .core.duplicate_logic import DuplicateLogicMixin
 
+# Delay before writing settings, so bursts of option changes are saved once
+SAVE_DEBOUNCE_MS = 500
+
 
 class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, DuplicateLogicMixin, ttk_bs.Window):
     """Main application window for the ROM Duplicate Manager.
@@ -84,10 +89,10 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
         self.title("ROM Duplicate Manager")
         self.geometry("1100x600")
 
-        # Set the application icon
-        icon = get_icon_photo()
-        if icon:
-            self.iconphoto(False, icon)
+        # Set the application icon (decoded once and reused by popups)
+        self.icon_photo = get_icon_photo()
+        if self.icon_photo:
+            self.iconphoto(False, self.icon_photo)
 
         # Set proper window close protocol
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -100,20 +105,19 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
         self._setup_ui_components()
         self._apply_initial_theme()
 
-    def _load_saved_settings(self, config: configparser.ConfigParser) -> None:
+    def _load_saved_settings(self, config: Dict[str, Any]) -> None:
         """Load saved settings from configuration file."""
-        self.theme_saved = config.get('Settings', 'theme', fallback=self.DEFAULT_THEME)
-        self.dark_mode_saved = config.getboolean('Settings', 'dark_mode', fallback=False)
-        self.row_colors_saved = config.getboolean('Settings', 'row_colors',
-                                                 fallback=config.getboolean('Settings', 'alternate_colors', fallback=True))
-        self.language_saved = config.get('Settings', 'language', fallback='Any')
-        self.smart_select_saved = config.getboolean('Settings', 'smart_select', fallback=False)
-        self.scan_images_saved = config.getboolean('Settings', 'scan_images', fallback=False)
-        self.match_size_saved = config.getboolean('Settings', 'match_size', fallback=False)
-        self.permanent_delete_saved = config.getboolean('Settings', 'permanent_delete', fallback=False)
-        self.use_regex_saved = config.getboolean('Settings', 'use_regex', fallback=False)
-        self.file_type_saved = config.get('Settings', 'file_type', fallback='Archive')
-        self.search_in_path_saved = config.getboolean('Settings', 'search_in_path', fallback=False)
+        self.theme_saved = config.get('theme', self.DEFAULT_THEME)
+        self.dark_mode_saved = config.get('dark_mode', False)
+        self.row_colors_saved = config.get('row_colors', config.get('alternate_colors', True))
+        self.language_saved = config.get('language', 'Any')
+        self.smart_select_saved = config.get('smart_select', False)
+        self.scan_images_saved = config.get('scan_images', False)
+        self.match_size_saved = config.get('match_size', False)
+        self.permanent_delete_saved = config.get('permanent_delete', False)
+        self.use_regex_saved = config.get('use_regex', False)
+        self.file_type_saved = config.get('file_type', 'Archive')
+        self.search_in_path_saved = config.get('search_in_path', False)
 
     def _initialize_variables(self) -> None:
         """Initialize all tkinter variables and application state."""
@@ -152,12 +156,56 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
         # Data storage
         self.duplicates = {}
         self.non_duplicates = {}
+        self.file_sizes: Dict[str, int] = {}  # Size cache, reset on each scan
+        self._file_stems: Optional[Dict[str, str]] = None  # path -> lowercased name
+        self._stem_counts: Counter = Counter()
+        self._all_stems: FrozenSet[str] = frozenset()  # keys of _stem_counts
+        self._image_index: Optional[List[Tuple[str, str]]] = None
+        self._image_index_folder: Optional[str] = None
+        self._orphaned_images: Optional[List[str]] = None  # orphans with nothing deleted
+        self._priority_cache: Dict[str, Tuple] = {}  # path -> smart select priority
+        self._priority_context: Optional[Tuple[str, str]] = None  # (language, folder)
+        self._priority_root = ''  # folder from _priority_context with '/' separators
+        self._file_traits: Dict[str, Tuple] = {}  # path -> parsed name details for priority
 
         # Async scanner instance
         self._scanner = AsyncScanner()
+        # Background workers for disk reads that don't touch Tk
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        # Image folder listing started by _prefetch_image_index, if any
+        self._image_index_future: Optional[Future] = None
+
+        # Pending debounced filter update (after() id)
+        self._filter_after_id = None
+        # Pending debounced settings write (after() id)
+        self._save_after_id = None
+        # Pending coalesced status label update (after_idle() id)
+        self._status_after_id = None
+        # Inputs of the last status label update (see update_status_label)
+        self._last_status_key: Optional[Tuple] = None
+        # Last compiled filter pattern: ((pattern, use_regex), compiled)
+        self._compiled_filter = (None, None)
+        # Tree item IDs currently tagged 'to_remove'
+        self._to_remove_items: Set[str] = set()
+        # File path of each file item in the tree (avoids Tcl 'values' lookups)
+        self._item_paths: Dict[str, str] = {}
+        # Current tags of each tree item, mirrored from the tree (see _set_item_tags)
+        self._item_tags: Dict[str, Tuple[str, ...]] = {}
+        # Lowercased (filename, path) of each file item, used as sort keys
+        self._item_sort_text: Dict[str, Tuple[str, str]] = {}
+        # Name, lowercased name and duplicate flag of each group item
+        self._group_info: Dict[str, Tuple[str, str, bool]] = {}
+        # Child item IDs of each group item, both in tree order
+        self._group_children: Dict[str, List[str]] = {}
+        # Group item ID of each file item
+        self._item_parents: Dict[str, str] = {}
+        # Filter text per file item, keyed by search-in-path mode (see _get_filter_corpus)
+        self._filter_corpus: Dict[bool, List[Tuple[str, str, str]]] = {}
+        # Whether tree tag styles need reconfiguring for a theme change
+        self._tag_colors_dirty = True
 
         # Set up variable tracing
-        self.filter_text.trace_add('write', self.on_filter_change)
+        self.filter_text.trace_add('write', self.schedule_filter)
         self._smart_select_trace = self.smart_select.trace_add('write', self.on_smart_select_change)
 
     def _setup_ui_components(self) -> None:
@@ -192,7 +240,7 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
         b1_row2.pack(fill='x', pady=1)
         ttk.Label(b1_row2, text="File Type:").pack(side='left', padx=2)
         self.type_combo = ttk.Combobox(b1_row2, textvariable=self.file_type_filter,
-                                       values=list(self.file_types.keys()),
+                                       values=DEFAULT_FILE_TYPE_NAMES,
                                        state='readonly', width=12)
         self.type_combo.pack(side='left', padx=2)
         self.type_combo.bind('<<ComboboxSelected>>', self.on_file_type_change)
@@ -209,9 +257,7 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
         b2_row1 = ttk.Frame(block2)
         b2_row1.pack(fill='x', pady=3)
         self.lang_combo = ttk.Combobox(b2_row1, textvariable=self.language_filter,
-                                       values=['Any', 'English-US', 'English-EU', 'Japanese', 'French', 'German',
-                                              'Spanish', 'Italian', 'Dutch', 'Portuguese', 'Swedish',
-                                              'Chinese', 'Korean'],
+                                       values=DEFAULT_LANGUAGE_OPTIONS,
                                        state='readonly', width=12)
         self.lang_combo.pack(side='left', padx=2)
         self.lang_combo.bind('<<ComboboxSelected>>', self.on_language_change)
@@ -243,7 +289,7 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
         self.regex_check = ttk.Checkbutton(b3_row1, text="Regex", variable=self.use_regex, command=self.on_regex_toggle)
         self.regex_check.pack(side='left', padx=(8, 5))
         create_tooltip(self.regex_check, "Use Regular Expressions for filtering")
-        self.path_search_check = ttk.Checkbutton(b3_row1, text="Add Path", variable=self.search_in_path, command=self.on_filter_change)
+        self.path_search_check = ttk.Checkbutton(b3_row1, text="Add Path", variable=self.search_in_path, command=self.schedule_filter)
         self.path_search_check.pack(side='left', padx=5)
         create_tooltip(self.path_search_check, "Include the full file path when filtering")
 
@@ -346,6 +392,7 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
 
         # Context Menu
         self.context_menu = tk.Menu(self, tearoff=0)
+        self._context_menu_colors: Optional[Tuple[str, str, str]] = None  # last applied (bg, fg, active bg)
         self.context_menu.add_command(label="Open File Location", command=self.open_file_location)
         self.context_menu.add_command(label="Open File", command=self.open_file)
         self.context_menu.add_separator()
@@ -384,11 +431,26 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
 
     def on_closing(self) -> None:
         """Handle window close event properly."""
-        self.save_settings()
+        self._write_settings()
+        self._executor.shutdown(wait=False)
         self.destroy()
 
     def save_settings(self) -> None:
-        """Save current application settings to configuration file."""
+        """Schedule saving the current settings to the configuration file.
+
+        Each call restarts a short timer, so toggling several options in a
+        row results in a single write. Pending changes are written
+        immediately when the window is closed.
+        """
+        if self._save_after_id:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(SAVE_DEBOUNCE_MS, self._write_settings)
+
+    def _write_settings(self) -> None:
+        """Write current application settings to the configuration file now."""
+        if self._save_after_id:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
         save_config(
             self.dark_mode_enabled.get(), self.row_colors.get(),
             self.language_filter.get(), self.smart_select.get(),
@@ -405,88 +467,166 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
             self.folder.set(folder)
             self.scan()
 
-    def get_orphaned_images(self, keep_filenames: Optional[Set[str]] = None) -> List[str]:
-        """Get list of orphaned image files that don't have corresponding ROMs."""
+    def get_orphaned_images(self, keep_filenames: Optional[AbstractSet[str]] = None) -> List[str]:
+        """Get list of orphaned image files that don't have corresponding ROMs.
+
+        The images folder is listed once per scan; each call is then only a
+        set lookup per image. The result for the default (nothing deleted)
+        case is also kept until the next scan.
+
+        Args:
+            keep_filenames: Lowercased ROM names to keep (default: all scanned files)
+
+        Returns:
+            List of full paths to orphaned image files
+        """
         folder = self.folder.get()
-        if not folder or not os.path.isdir(folder):
+        if not folder:
             return []
 
         images_folder = os.path.join(folder, 'images')
-        if not os.path.isdir(images_folder):
-            return []
+        if self._image_index is None or self._image_index_folder != images_folder:
+            future = self._image_index_future
+            if future is not None and self._image_index_folder == images_folder:
+                # Listing started in the background by _prefetch_image_index
+                self._image_index = future.result()
+            else:
+                self._image_index = build_image_index(images_folder, self.file_types.get("Images", set()))
+            self._image_index_future = None
+            self._image_index_folder = images_folder
+            self._orphaned_images = None
 
         if keep_filenames is None:
-            keep_filenames = set()
-            # Generate keep list from current scan results
-            for paths in self.duplicates.values():
-                for path in paths:
-                    keep_filenames.add(os.path.splitext(os.path.basename(path))[0].lower())
-            for paths in self.non_duplicates.values():
-                for path in paths:
-                    keep_filenames.add(os.path.splitext(os.path.basename(path))[0].lower())
-
-        image_extensions = self.file_types.get("Images", set())
-        orphaned = []
-
-        try:
-            for f in os.listdir(images_folder):
-                full_path = os.path.join(images_folder, f)
-                if os.path.isfile(full_path):
-                    name, ext = os.path.splitext(f)
-                    if image_extensions and ext.lower() in image_extensions:
-                        match_name = name.lower()
-                        # Handle "-image" suffix convention
-                        if match_name.endswith("-image"):
-                            match_name = match_name[:-6]
-                        if match_name not in keep_filenames:
-                            orphaned.append(full_path)
-        except OSError:
-            pass  # Handle permission errors gracefully
-
-        return orphaned
+            if self._orphaned_images is None:
+                keep_filenames = self.get_keep_filenames()
+                self._orphaned_images = [path for match_name, path in self._image_index
+                                         if match_name not in keep_filenames]
+            return self._orphaned_images
+
+        return [path for match_name, path in self._image_index if match_name not in keep_filenames]
+
+    def get_keep_filenames(self, exclude_paths: Optional[AbstractSet[str]] = None) -> AbstractSet[str]:
+        """Get lowercased names (without extension) of scanned files that are kept.
+
+        Args:
+            exclude_paths: Paths about to be deleted, whose names only count if
+                another file with the same name remains
+
+        Returns:
+            Set of names that images may belong to
+        """
+        if self._file_stems is None:
+            self._index_file_stems({
+                path: os.path.splitext(os.path.basename(path))[0].lower()
+                for groups in (self.duplicates, self.non_duplicates)
+                for paths in groups.values()
+                for path in paths
+            })
+
+        if not exclude_paths:
+            return self._all_stems
+
+        removed = Counter(self._file_stems[p] for p in exclude_paths if p in self._file_stems)
+        return {stem for stem, count in self._stem_counts.items() if count > removed[stem]}
+
+    def _index_file_stems(self, file_stems: Dict[str, str]) -> None:
+        """Store the lowercased stem of every scanned file and count each stem.
+
+        Args:
+            file_stems: Mapping of file path to lowercased name without extension
+        """
+        self._file_stems = file_stems
+        self._stem_counts = Counter(file_stems.values())
+        self._all_stems = frozenset(self._stem_counts)
+
+    def _reset_scan_caches(self) -> None:
+        """Drop data derived from the current scan results and folder contents."""
+        self.file_sizes = {}
+        self._file_stems = None
+        self._stem_counts = Counter()
+        self._all_stems = frozenset()
+        self._image_index = None
+        self._image_index_folder = None
+        self._image_index_future = None
+        self._orphaned_images = None
+        self._last_status_key = None
+        self._priority_cache = {}
+        self._file_traits = {}
+
+    def _prefetch_image_index(self) -> None:
+        """Start listing the images folder on a worker thread.
+
+        Called when a scan completes, so the listing overlaps with
+        populating the tree, and
+        get_orphaned_images only waits for whatever is left of it.
+        """
+        folder = self.folder.get()
+        if not folder or not self.scan_images.get():
+            return
+        images_folder = os.path.join(folder, 'images')
+        self._image_index_future = self._executor.submit(
+            build_image_index, images_folder, self.file_types.get("Images", set()))
+        self._image_index_folder = images_folder
 
     def format_size(self, size_bytes: int) -> str:
         """Format bytes into a human-readable string."""
-        if size_bytes == 0:
-            return "0 B"
-        size_name = ("B", "KB", "MB", "GB", "TB")
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
-        return f"{s} {size_name[i]}"
+        return format_size(size_bytes)
+
+    def get_file_size(self, path: str) -> int:
+        """Get a file's size, cached until the next scan completes.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Size in bytes, or 0 if the file can't be accessed
+        """
+        size = self.file_sizes.get(path)
+        if size is None:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = 0  # Skip files we can't access
+            self.file_sizes[path] = size
+        return size
+
+    def schedule_status_update(self) -> None:
+        """Update the status label once pending UI work is done.
+
+        Toggling a multi-row selection changes one row at a time; this
+        collapses those changes into a single status recalculation.
+        """
+        if self._status_after_id is None:
+            self._status_after_id = self.after_idle(self._run_status_update)
+
+    def _run_status_update(self) -> None:
+        """Run a status label update scheduled by schedule_status_update."""
+        self._status_after_id = None
+        self.update_status_label()
 
     def update_status_label(self) -> None:
-        """Update the status label with scan results and deletion size information."""
+        """Update the status label with scan results and deletion size information.
+
+        Nothing is recalculated if the marked files and the settings that
+        affect the text are the same as on the previous update.
+        """
+        files_to_delete_paths = frozenset(
+            path for path in map(self._item_paths.get, self._to_remove_items) if path)
+        scan_images = self.scan_images.get()
+        status_key = (files_to_delete_paths, scan_images, self.folder.get(),
+                      len(self.duplicates), len(self.non_duplicates))
+        if status_key == self._last_status_key:
+            return
+        self._last_status_key = status_key
+
         status = f"Found {len(self.duplicates)} duplicate group(s) and {len(self.non_duplicates)} unique file(s)."
 
         # Calculate total size of files marked for removal
-        total_size_to_remove = 0
-        items_to_remove = self.tree.tag_has('to_remove')
-        files_to_delete_paths = set()
-
-        for item in items_to_remove:
-            values = self.tree.item(item, 'values')
-            if values:
-                path = values[0]
-                files_to_delete_paths.add(path)
-                try:
-                    if os.path.exists(path):
-                        total_size_to_remove += os.path.getsize(path)
-                except Exception:
-                    pass  # Skip files we can't access
+        total_size_to_remove = sum(map(self.get_file_size, files_to_delete_paths))
 
-        if self.scan_images.get():
+        if scan_images:
             # Calculate orphaned images
-            all_files = []
-            for paths in self.duplicates.values():
-                all_files.extend(paths)
-            for paths in self.non_duplicates.values():
-                all_files.extend(paths)
-
-            keep_filenames = set()
-            for path in all_files:
-                if path not in files_to_delete_paths:
-                    keep_filenames.add(os.path.splitext(os.path.basename(path))[0].lower())
+            keep_filenames = self.get_keep_filenames(files_to_delete_paths)
 
             # Show current orphaned images
             orphaned_now = self.get_orphaned_images()
@@ -496,11 +636,7 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
             # Add size of images that will be deleted
             orphaned_to_delete = self.get_orphaned_images(keep_filenames)
             for p in orphaned_to_delete:
-                try:
-                    if os.path.exists(p):
-                        total_size_to_remove += os.path.getsize(p)
-                except Exception:
-                    pass
+                total_size_to_remove += self.get_file_size(p)
 
         # Update first status label
         if hasattr(self, 'status_label'):
@@ -534,9 +670,8 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
         progress_popup.grab_set()
 
         # Set the same icon as main window
-        icon = get_icon_photo()
-        if icon:
-            progress_popup.iconphoto(False, icon)
+        if self.icon_photo:
+            progress_popup.iconphoto(False, self.icon_photo)
 
         # Center popup on parent window
         x = self.winfo_x() + (self.winfo_width() // 2) - 200
@@ -579,27 +714,33 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
 
         def poll_scanner():
             """Poll the scanner for progress updates."""
+            # Drain everything queued since the last tick; only the newest
+            # progress update needs to be shown
+            progress = None
             result = self._scanner.get_result()
+            while result is not None and result.status == ScanStatus.PROGRESS:
+                progress = result
+                result = self._scanner.get_result()
+
+            if progress is not None:
+                # Update progress display
+                pb['maximum'] = progress.total
+                pb['value'] = progress.progress
+                display_msg = progress.message[:57] + "..." if len(progress.message) > 60 else progress.message
+                lbl.config(text=display_msg)
 
             if result is None:
-                # No result yet, continue polling
-                if self._scanner.is_running:
+                # No final result yet, continue polling
+                if progress is not None or self._scanner.is_running:
                     self.after(16, poll_scanner)  # ~60fps polling
                 return
 
-            if result.status == ScanStatus.PROGRESS:
-                # Update progress display
-                pb['maximum'] = result.total
-                pb['value'] = result.progress
-                display_msg = result.message[:57] + "..." if len(result.message) > 60 else result.message
-                lbl.config(text=display_msg)
-                # Continue polling
-                self.after(16, poll_scanner)
-
-            elif result.status == ScanStatus.COMPLETE:
+            if result.status == ScanStatus.COMPLETE:
                 # Scan finished successfully
                 self.duplicates = result.duplicates or {}
                 self.non_duplicates = result.non_duplicates or {}
+                self._reset_scan_caches()
+                self._prefetch_image_index()
                 progress_popup.destroy()
                 self.populate_tree()
                 self.update_status_label()
@@ -618,7 +759,7 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
 
     def on_language_change(self, event: Optional[tk.Event] = None) -> None:
         """Handle language filter selection change."""
-        if hasattr(self, 'tree') and self.tree.get_children():
+        if self._group_children:
             self.apply_base_suggestions()
         self.save_settings()
 
@@ -661,13 +802,14 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
 
     def on_smart_select_change(self, *args) -> None:
         """Handle smart select checkbox change with user confirmation."""
-        if not hasattr(self, 'tree') or not self.tree.get_children():
+        if not self._group_children:
             self.save_settings()
             return
 
         if self.smart_select.get():
             # Check for existing manual selections
-            has_manual = any(self.tree.tag_has('manual'))
+            manual_items = [item for item, tags in self._item_tags.items() if 'manual' in tags]
+            has_manual = bool(manual_items)
 
             if has_manual:
                 confirm = messagebox.askokcancel(
@@ -683,11 +825,9 @@ class DuplicateManager(ThemeMixin, MenuBarMixin, FileListMixin, DialogMixin, Dup
                     return
                 else:
                     # Clear all manual tags
-                    for item in self.tree.tag_has('manual'):
-                        tags = list(self.tree.item(item, 'tags'))
-                        if 'manual' in tags:
-                            tags.remove('manual')
-                        self.tree.item(item, tags=tuple(tags))
+                    self._set_tags_batch([
+                        (item, tuple(t for t in self._item_tags[item] if t != 'manual'))
+                        for item in manual_items])
 
         self.apply_base_suggestions()
         self.save_settings()
@@ -77,17 +77,26 @@ class AutoScrollbar(ttk.Scrollbar):
     based on content size.
     """
 
+    # Last applied visibility state (None until the first set call)
+    _hidden: Optional[bool] = None
+
     def set(self, first: Union[str, float], last: Union[str, float]) -> None:  # type: ignore[override]
         """Override set method to handle auto-hiding.
 
+        The grid manager is only called when visibility actually changes,
+        since set is invoked on every scroll step.
+
         Args:
             first: Lower bound of scrollbar position
             last: Upper bound of scrollbar position
         """
-        if float(first) <= 0.0 and float(last) >= 1.0:
-            self.grid_remove()
-        else:
-            self.grid()
+        hidden = float(first) <= 0.0 and float(last) >= 1.0
+        if hidden != self._hidden:
+            if hidden:
+                self.grid_remove()
+            else:
+                self.grid()
+            self._hidden = hidden
         ttk.Scrollbar.set(self, first, last)
 
 
@@ -102,15 +111,25 @@ def create_tooltip(widget: tk.Widget, text: str) -> None:
         widget.tooltip.text = text  # type: ignore[attr-defined]
     else:
         widget.tooltip = ToolTip(widget, text)  # type: ignore[attr-defined]
+        # Register the child handlers once under a widget-specific bind tag
+        tag = f"tooltip{id(widget)}"
+        widget.tooltip_tag = tag  # type: ignore[attr-defined]
+        widget.bind_class(tag, "<Enter>", widget.tooltip.schedule_tip)  # type: ignore[attr-defined]
+        widget.bind_class(tag, "<Leave>", widget.tooltip.hide_tip)  # type: ignore[attr-defined]
+
+    tag = widget.tooltip_tag  # type: ignore[attr-defined]
 
     # Ensure tooltips work on complex widgets like Combobox
     def bind_children(w: tk.Misc) -> None:
         for child in w.winfo_children():
-            child.bind("<Enter>", widget.tooltip.schedule_tip, add="+")  # type: ignore[attr-defined]
-            child.bind("<Leave>", widget.tooltip.hide_tip, add="+")  # type: ignore[attr-defined]
+            tags = child.bindtags()
+            if tag not in tags:
+                # Place it before the child's own tag, so a bind() handler
+                # returning "break" can't stop the tooltip showing or hiding
+                child.bindtags((tag,) + tags)
             bind_children(child)
 
     try:
         bind_children(widget)
     except tk.TclError:
-        pass
\ No newline at end of file
+        pass
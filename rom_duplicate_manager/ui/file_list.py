@@ -11,9 +11,82 @@ from tkinter import ttk
 import ttkbootstrap as ttk_bs
 import fnmatch
 import re
-from typing import List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, Any, Pattern, Set, Tuple
 from send2trash import send2trash
 
+# Delay before re-filtering after the filter text or options change
+FILTER_DEBOUNCE_MS = 150
+
+# Characters with special meaning in a regular expression
+_REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
+
+# Keep/delete mark tags, and the same plus the manual-mark flag
+_MARK_TAGS = frozenset(('base', 'to_remove'))
+_MANUAL_MARK_TAGS = _MARK_TAGS | {'manual'}
+
+# Worker threads used for permanent deletion
+DELETE_WORKERS = 8
+
+# Interval between deletion progress redraws
+DELETE_REFRESH_MS = 50
+
+# Whether files can be removed relative to an open directory (unlinkat)
+_UNLINK_DIR_FD = os.unlink in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY')
+
+
+def _delete_file(path: str, permanent: bool, skip_missing: bool, dir_fd: Optional[int] = None) -> bool:
+    """Delete a file or move it to the trash (runs on a worker thread).
+
+    Args:
+        path: Native path of the file to delete
+        permanent: Whether to delete permanently instead of trashing
+        skip_missing: Whether a file that no longer exists is silently skipped
+        dir_fd: Open descriptor of the file's directory, in which case path
+            is just the file name (permanent deletion only)
+
+    Returns:
+        True if the file was deleted, False if it was skipped
+    """
+    if permanent:
+        try:
+            os.unlink(path, dir_fd=dir_fd)
+        except FileNotFoundError:
+            if not skip_missing:
+                raise
+            return False
+        return True
+
+    # Trash backends don't report missing files consistently, so check first
+    if skip_missing and not os.path.exists(path):
+        return False
+    send2trash(path)
+    return True
+
+
+def _split_dir_fd(path: str, dir_fds: Dict[str, Optional[int]]) -> Tuple[str, Optional[int]]:
+    """Split a path into a file name and a shared descriptor of its directory.
+
+    Each directory is opened once and its descriptor kept in dir_fds, so the
+    kernel resolves the directory path once rather than once per file.
+
+    Args:
+        path: Native path of a file
+        dir_fds: Directory path -> open descriptor (None if it couldn't be opened)
+
+    Returns:
+        (file name, directory descriptor), or (path, None) if the directory
+        couldn't be opened
+    """
+    directory, name = os.path.split(path)
+    if directory not in dir_fds:
+        try:
+            dir_fds[directory] = os.open(directory or '.', os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            dir_fds[directory] = None
+    dir_fd = dir_fds[directory]
+    return (path, None) if dir_fd is None else (name, dir_fd)
+
 
 class FileListMixin:
     """Mixin class providing file list tree management functionality."""
@@ -25,28 +98,66 @@ class FileListMixin:
         applying smart selection if enabled and setting up proper visual styling.
         """
         self.tree.delete(*self.tree.get_children())
+        self._to_remove_items.clear()
+        self._item_paths.clear()
+        self._item_tags.clear()
+        self._item_sort_text.clear()
+        self._group_info.clear()
+        self._group_children = {}
+        self._item_parents.clear()
+        self._filter_corpus = {}
+        smart_select = self.smart_select.get()
+        file_stems = {}
 
         # Add duplicate groups
         for base_name in sorted(self.duplicates.keys()):
             files = self.duplicates[base_name]
             parent_id = self.tree.insert('', 'end', text=base_name, open=True, tags=('duplicate_group',))
-            base_file = self.get_base_file(files)
+            self._item_tags[parent_id] = ('duplicate_group',)
+            self._group_info[parent_id] = (base_name, base_name.lower(), True)
+            children = self._group_children[parent_id] = []
+            # Stable sort puts the same file first that get_base_file() would pick
             sorted_files = sorted(files, key=self.get_file_priority)
+            base_file = sorted_files[0]
 
+            # Tags are passed to insert() directly instead of a follow-up item() call
             for f in sorted_files:
-                child_id = self.tree.insert(parent_id, 'end', text=os.path.basename(f), values=(f,))
-                if self.smart_select.get():
-                    if f == base_file:
-                        self.tree.item(child_id, tags=('base',))
-                    else:
-                        self.tree.item(child_id, tags=('to_remove',))
+                if smart_select:
+                    tags = ('base',) if f == base_file else ('to_remove',)
+                else:
+                    tags = ()
+                name = os.path.basename(f)
+                name_lower = name.lower()
+                child_id = self.tree.insert(parent_id, 'end', text=name, values=(f,), tags=tags)
+                self._item_paths[child_id] = f
+                self._item_tags[child_id] = tags
+                self._item_sort_text[child_id] = (name_lower, f.lower())
+                self._item_parents[child_id] = parent_id
+                children.append(child_id)
+                file_stems[f] = os.path.splitext(name_lower)[0]
+                if f != base_file and smart_select:
+                    self._to_remove_items.add(child_id)
 
         # Add unique file groups
         for base_name in sorted(self.non_duplicates.keys()):
             files = self.non_duplicates[base_name]
             parent_id = self.tree.insert('', 'end', text=base_name, open=False, tags=('unique_group',))
+            self._item_tags[parent_id] = ('unique_group',)
+            self._group_info[parent_id] = (base_name, base_name.lower(), False)
+            children = self._group_children[parent_id] = []
             for f in files:
-                self.tree.insert(parent_id, 'end', text=os.path.basename(f), values=(f,))
+                name = os.path.basename(f)
+                name_lower = name.lower()
+                child_id = self.tree.insert(parent_id, 'end', text=name, values=(f,))
+                self._item_paths[child_id] = f
+                self._item_tags[child_id] = ()
+                self._item_sort_text[child_id] = (name_lower, f.lower())
+                self._item_parents[child_id] = parent_id
+                children.append(child_id)
+                file_stems[f] = os.path.splitext(name_lower)[0]
+
+        # Lowercased stems for orphaned image matching (see get_keep_filenames)
+        self._index_file_stems(file_stems)
 
         self.update_tag_colors()
         self.refresh_row_colors()
@@ -67,13 +178,11 @@ class FileListMixin:
         Args:
             item: Tree item ID to toggle
         """
-        if not item:
-            return
-        parent = self.tree.parent(item)
-        if not parent:
+        # Only file items (children of a group) can be toggled
+        if item not in self._item_parents:
             return
 
-        tags = list(self.tree.item(item, 'tags'))
+        tags = list(self._item_tags.get(item, ()))
         row_tag = next((t for t in tags if t in ('oddrow', 'evenrow')), None)
         filtered_tag = 'filtered' if 'filtered' in tags else None
 
@@ -92,8 +201,54 @@ class FileListMixin:
         if filtered_tag:
             tags.append(filtered_tag)
 
-        self.tree.item(item, tags=tuple(tags))
-        self.update_status_label()
+        self._set_item_tags(item, tuple(tags))
+        self.schedule_status_update()
+
+    def _set_item_tags(self, item: str, tags: tuple) -> None:
+        """Set an item's tags and keep the Python-side tag state in sync.
+
+        Item tags are read back from self._item_tags rather than the tree,
+        so every change to them must go through here.
+
+        Args:
+            item: Tree item ID
+            tags: New tags for the item
+        """
+        self.tree.item(item, tags=tags)
+        self._item_tags[item] = tags
+        if 'to_remove' in tags:
+            self._to_remove_items.add(item)
+        else:
+            self._to_remove_items.discard(item)
+
+    def _set_tags_batch(self, changes: List[Tuple[str, tuple]],
+                        open_states: Optional[List[Tuple[str, bool]]] = None) -> None:
+        """Set the tags of many items with a single Tcl evaluation.
+
+        Equivalent to calling _set_item_tags for each change, but the tree
+        commands are joined into one script instead of crossing into Tcl
+        once per row. Item IDs are generated by the tree and tags are the
+        fixed identifiers used by this class, so neither needs quoting.
+
+        Args:
+            changes: List of (item ID, new tags) pairs
+            open_states: Optional list of (item ID, open) pairs to expand or
+                collapse in the same script
+        """
+        if not changes and not open_states:
+            return
+        tree = str(self.tree)
+        script = [f"{tree} item {item} -tags {{{' '.join(tags)}}}" for item, tags in changes]
+        if open_states:
+            script.extend(f"{tree} item {item} -open {int(is_open)}" for item, is_open in open_states)
+        self.tree.tk.eval('\n'.join(script))
+
+        for item, tags in changes:
+            self._item_tags[item] = tags
+            if 'to_remove' in tags:
+                self._to_remove_items.add(item)
+            else:
+                self._to_remove_items.discard(item)
 
     def on_tree_double_click(self, event: tk.Event) -> str:
         """Handle double-click to toggle item status.
@@ -138,16 +293,19 @@ class FileListMixin:
                 self.tree.selection_set(item)
 
             # Only show menu for file items (items with parents)
-            if self.tree.parent(item):
-                # Apply current theme to menu
+            if item in self._item_parents:
+                # Apply current theme to menu (only when the colors changed)
                 is_dark = self.dark_mode_enabled.get()
                 bg = self.dark_bg if is_dark else 'white'
                 fg = self.dark_fg if is_dark else 'black'
-                self.context_menu.configure(
-                    bg=bg, fg=fg,
-                    activebackground=self.selection_bg,
-                    activeforeground='white'
-                )
+                colors = (bg, fg, self.selection_bg)
+                if colors != self._context_menu_colors:
+                    self.context_menu.configure(
+                        bg=bg, fg=fg,
+                        activebackground=self.selection_bg,
+                        activeforeground='white'
+                    )
+                    self._context_menu_colors = colors
                 self.context_menu.post(event.x_root, event.y_root)
 
     def open_file_location(self) -> None:
@@ -156,7 +314,9 @@ class FileListMixin:
         if not selected:
             return
 
-        path = self.tree.item(selected[0], 'values')[0]
+        path = self._item_paths.get(selected[0])
+        if not path:
+            return
         path = os.path.normpath(path)
         if os.path.exists(path):
             try:
@@ -170,7 +330,9 @@ class FileListMixin:
         if not selected:
             return
 
-        path = self.tree.item(selected[0], 'values')[0]
+        path = self._item_paths.get(selected[0])
+        if not path:
+            return
         path = os.path.normpath(path)
         if os.path.exists(path):
             try:
@@ -183,35 +345,52 @@ class FileListMixin:
         selected = self.tree.selection()
         for item in selected:
             self.toggle_item_status(item)
-        self.update_tag_colors()
 
-    def mark_selected_keep(self) -> None:
-        """Mark all selected file items to be kept (not deleted)."""
-        for item in self.tree.selection():
-            if not self.tree.parent(item):
-                continue
+    def _mark_items(self, items: Iterable[str], mark: str) -> None:
+        """Manually mark file items, leaving rows that already carry the mark alone.
 
-            tags = list(self.tree.item(item, 'tags'))
-            tags = [t for t in tags if t not in ('base', 'to_remove')]
-            tags.extend(['base', 'manual'])
-            self.tree.item(item, tags=tuple(tags))
+        Args:
+            items: File tree item IDs to mark
+            mark: 'base' to keep the files or 'to_remove' to delete them
+        """
+        changes = []
+        for item in items:
+            old_tags = self._item_tags.get(item, ())
+            if mark in old_tags and 'manual' in old_tags:
+                continue
+            changes.append((item, tuple(t for t in old_tags if t not in _MANUAL_MARK_TAGS) + (mark, 'manual')))
+        self._set_tags_batch(changes)
 
-        self.update_tag_colors()
+    def mark_selected_keep(self) -> None:
+        """Mark all selected file items to be kept (not deleted)."""
+        self._mark_items([item for item in self.tree.selection() if item in self._item_parents], 'base')
         self.update_status_label()
 
     def mark_selected_delete(self) -> None:
         """Mark all selected file items for deletion."""
-        for item in self.tree.selection():
-            if not self.tree.parent(item):
-                continue
+        self._mark_items([item for item in self.tree.selection() if item in self._item_parents], 'to_remove')
+        self.update_status_label()
 
-            tags = list(self.tree.item(item, 'tags'))
-            tags = [t for t in tags if t not in ('base', 'to_remove')]
-            tags.extend(['to_remove', 'manual'])
-            self.tree.item(item, tags=tuple(tags))
+    def schedule_filter(self, *args) -> None:
+        """Debounce filter updates while the user is typing.
 
-        self.update_tag_colors()
-        self.update_status_label()
+        Each call restarts a short timer, so the filter is applied once
+        typing pauses instead of on every keystroke.
+
+        Args:
+            *args: Variable arguments from tkinter trace callback
+        """
+        self._cancel_scheduled_filter()
+        self._filter_after_id = self.after(FILTER_DEBOUNCE_MS, self.on_filter_change)  # type: ignore[attr-defined]
+
+    def _cancel_scheduled_filter(self) -> None:
+        """Cancel a pending debounced filter update, if any."""
+        if self._filter_after_id:
+            try:
+                self.after_cancel(self._filter_after_id)  # type: ignore[attr-defined]
+            except tk.TclError:
+                pass
+            self._filter_after_id = None
 
     def on_filter_change(self, *args) -> None:
         """Handle filter text or search options change.
@@ -219,6 +398,7 @@ class FileListMixin:
         Args:
             *args: Variable arguments from tkinter trace callback
         """
+        self._filter_after_id = None
         self.apply_filter()
 
     def on_regex_toggle(self) -> None:
@@ -248,6 +428,7 @@ class FileListMixin:
     def clear_filter(self) -> None:
         """Clear the current filter text and reset the view."""
         self.filter_text.set('')
+        self._cancel_scheduled_filter()
         self.apply_filter()
 
     def check_match(self, pattern: str, filename: str, filepath: Optional[str] = None) -> bool:
@@ -272,17 +453,114 @@ class FileListMixin:
         else:
             text_to_match = filename.replace(" - Copy", "")
 
+        return self._compile_filter(pattern)(text_to_match, text_to_match.lower())
+
+    def _compile_filter(self, pattern: str) -> Callable[[str, str], bool]:
+        """Build a matcher for a filter pattern in the current search mode.
+
+        Callers compile once per traversal and call the matcher for each row.
+
+        Args:
+            pattern: The search pattern to match against
+
+        Returns:
+            Function taking the text to match and its lowercased form, and
+            returning True if the pattern matches
+        """
+        if not pattern:
+            return lambda text, text_lower: False
+
         if self.use_regex.get():
+            compiled = self._get_filter_regex(pattern, True)
+            if compiled is None:
+                return lambda text, text_lower: False
+            search = compiled.search
+            if pattern.isascii() and _REGEX_METACHARS.isdisjoint(pattern):
+                # A plain ASCII word is just a case-insensitive substring test.
+                # Non-ASCII text still goes through re, which also folds a few
+                # non-ASCII letters (e.g. the Kelvin sign) onto ASCII ones.
+                needle = pattern.lower()
+                return lambda text, text_lower: (
+                    needle in text_lower if text.isascii() else search(text) is not None)
+            return lambda text, text_lower: search(text) is not None
+
+        # Support wildcards * and ? in non-regex mode
+        if '*' in pattern or '?' in pattern:
+            compiled = self._get_filter_regex(pattern, False)
+            if compiled is None:
+                return lambda text, text_lower: False
+            match = compiled.match
+            normcase = os.path.normcase
+            return lambda text, text_lower: match(normcase(text_lower)) is not None
+
+        needle = pattern.lower()
+        return lambda text, text_lower: needle in text_lower
+
+    def _get_filter_regex(self, pattern: str, use_regex: bool) -> Optional[Pattern]:
+        """Get the compiled form of a filter pattern, reusing the last one.
+
+        check_match runs once per row with the same pattern, so the most
+        recent compilation is kept instead of going through re's cache or
+        fnmatch's translate step each time.
+
+        Args:
+            pattern: The search pattern
+            use_regex: True for a regular expression, False for a wildcard pattern
+
+        Returns:
+            Compiled pattern, or None if the regular expression is invalid
+        """
+        key = (pattern, use_regex)
+        if self._compiled_filter[0] != key:
             try:
-                return re.search(pattern, text_to_match, re.IGNORECASE) is not None
+                if use_regex:
+                    compiled = re.compile(pattern, re.IGNORECASE)
+                else:
+                    # Same translation fnmatch.fnmatch applies to a lowercased pattern
+                    compiled = re.compile(fnmatch.translate(os.path.normcase(pattern.lower())))
             except re.error:
-                return False
-        else:
-            # Support wildcards * and ? in non-regex mode
-            if '*' in pattern or '?' in pattern:
-                return fnmatch.fnmatch(text_to_match.lower(), pattern.lower())
-            else:
-                return pattern.lower() in text_to_match.lower()
+                compiled = None
+            self._compiled_filter = (key, compiled)
+        return self._compiled_filter[1]
+
+    def _get_filter_corpus(self, in_path: bool) -> List[Tuple[str, str, str]]:
+        """Get the text each file item is filtered on, built once per tree.
+
+        Args:
+            in_path: Whether to use full paths instead of filenames
+
+        Returns:
+            List of (item ID, text, lowercased text) with " - Copy" removed,
+            matching what check_match tests for each item
+        """
+        corpus = self._filter_corpus.get(in_path)
+        if corpus is None:
+            corpus = []
+            for item, path in self._item_paths.items():
+                text = (path if in_path else os.path.basename(path)).replace(" - Copy", "")
+                corpus.append((item, text, text.lower()))
+            self._filter_corpus[in_path] = corpus
+        return corpus
+
+    def get_filter_matches(self, pattern: str) -> Set[str]:
+        """Find all file items that match a filter pattern.
+
+        Equivalent to calling check_match on every file item, but the matcher
+        is built once and applied to precomputed (and pre-lowercased) text
+        instead of fetching each row's text from the tree.
+
+        Args:
+            pattern: The search pattern to match against
+
+        Returns:
+            Set of matching tree item IDs
+        """
+        if not pattern:
+            return set()
+
+        matcher = self._compile_filter(pattern)
+        corpus = self._get_filter_corpus(bool(self.search_in_path.get()))
+        return {item for item, text, text_lower in corpus if matcher(text, text_lower)}
 
     def mark_filtered_keep(self) -> None:
         """Mark all files matching the current filter to be kept.
@@ -293,18 +571,7 @@ class FileListMixin:
         if not text:
             return
 
-        for parent in self.tree.get_children():
-            for child in self.tree.get_children(parent):
-                filename = self.tree.item(child, 'text')
-                filepath = self.tree.item(child, 'values')[0] if self.tree.item(child, 'values') else None
-
-                if self.check_match(text, filename, filepath):
-                    tags = list(self.tree.item(child, 'tags'))
-                    tags = [t for t in tags if t not in ('base', 'to_remove')]
-                    tags.extend(['base', 'manual'])
-                    self.tree.item(child, tags=tuple(tags))
-
-        self.update_tag_colors()
+        self._mark_items(self.get_filter_matches(text), 'base')
         self.update_status_label()
 
     def mark_filtered_delete(self) -> None:
@@ -316,32 +583,22 @@ class FileListMixin:
         if not text:
             return
 
-        for parent in self.tree.get_children():
-            for child in self.tree.get_children(parent):
-                filename = self.tree.item(child, 'text')
-                filepath = self.tree.item(child, 'values')[0] if self.tree.item(child, 'values') else None
-
-                if self.check_match(text, filename, filepath):
-                    tags = list(self.tree.item(child, 'tags'))
-                    tags = [t for t in tags if t not in ('base', 'to_remove')]
-                    tags.extend(['to_remove', 'manual'])
-                    self.tree.item(child, tags=tuple(tags))
-
-        self.update_tag_colors()
+        self._mark_items(self.get_filter_matches(text), 'to_remove')
         self.update_status_label()
 
     def reset_marks(self) -> None:
         """Reset all manual keep/delete marks and reapply smart selection if enabled."""
-        for parent in self.tree.get_children():
-            for child in self.tree.get_children(parent):
-                tags = list(self.tree.item(child, 'tags'))
-                tags = [t for t in tags if t not in ('base', 'to_remove', 'manual')]
-                self.tree.item(child, tags=tuple(tags))
+        changes = []
+        for children in self._group_children.values():
+            for child in children:
+                old_tags = self._item_tags.get(child, ())
+                if _MANUAL_MARK_TAGS.isdisjoint(old_tags):
+                    continue
+                changes.append((child, tuple(t for t in old_tags if t not in _MANUAL_MARK_TAGS)))
+        self._set_tags_batch(changes)
 
         if self.smart_select.get():
             self.apply_base_suggestions()
-        else:
-            self.update_tag_colors()
         self.update_status_label()
 
     def apply_filter(self) -> None:
@@ -352,33 +609,36 @@ class FileListMixin:
         """
         text = self.filter_text.get()
         is_empty = not text
+        matches = self.get_filter_matches(text)
+        changes = []
+        open_states = []
 
-        for parent in self.tree.get_children():
+        for parent, children in self._group_children.items():
             has_matching_child = False
 
-            for child in self.tree.get_children(parent):
-                filename = self.tree.item(child, 'text')
-                filepath = self.tree.item(child, 'values')[0] if self.tree.item(child, 'values') else None
-                matches_filter = self.check_match(text, filename, filepath)
+            for child in children:
+                matches_filter = child in matches
 
                 if matches_filter or is_empty:
                     has_matching_child = True
 
                 # Update filtered tag - put filtered first so it overrides other tags
-                current_tags = list(self.tree.item(child, 'tags'))
+                old_tags = self._item_tags.get(child, ())
+                current_tags = list(old_tags)
                 if 'filtered' in current_tags:
                     current_tags.remove('filtered')
                 if matches_filter:
                     current_tags.insert(0, 'filtered')
-                self.tree.item(child, tags=tuple(current_tags))
+                current_tags = tuple(current_tags)
+                if current_tags != old_tags:
+                    changes.append((child, current_tags))
 
             # Expand/collapse parent based on matches
-            if not is_empty and not has_matching_child:
-                self.tree.item(parent, open=False)
-            else:
-                self.tree.item(parent, open=True)
+            open_states.append((parent, is_empty or has_matching_child))
 
-        self.update_tag_colors()
+        # Tag and open-state changes go to the tree as one script, so it lays
+        # out and redraws once for the whole pass
+        self._set_tags_batch(changes, open_states)
 
     def sort_tree(self, col: str, reverse: bool, user_initiated: bool = True) -> None:
         """Sort treeview content when a column header is clicked.
@@ -393,53 +653,57 @@ class FileListMixin:
             reverse: Whether to sort in reverse order
             user_initiated: Whether this sort was triggered by user clicking a column header
         """
+        # Lowercased filename or path, precomputed in populate_tree
+        text_index = 0 if col == '#0' else 1
+        sort_text = self._item_sort_text
+
         def get_sort_text(item_id):
             """Get the text value for sorting an item."""
-            if col == '#0':
-                return self.tree.item(item_id, 'text').lower()
-            else:
-                return self.tree.set(item_id, col).lower()
+            return sort_text[item_id][text_index]
+
+        def is_marked(item_id):
+            """Check if an item is marked as to_remove or base."""
+            tags = self._item_tags.get(item_id, ())
+            return 'to_remove' in tags or 'base' in tags
 
         def get_child_sort_key(item_id):
             """Get sort key for child items - marked items always first."""
-            tags = self.tree.item(item_id, 'tags')
             # Marked items (to_remove or base) get priority 0, unmarked get 1
-            is_marked = 'to_remove' in tags or 'base' in tags
-            priority = 0 if is_marked else 1
+            priority = 0 if is_marked(item_id) else 1
             text = get_sort_text(item_id)
             return (priority, text)
 
         # Get all top-level items (groups) and separate by type
         duplicate_groups = []
         unique_groups = []
-        for k in self.tree.get_children(''):
-            tags = self.tree.item(k, 'tags')
-            text = self.tree.item(k, 'text')
-            if 'duplicate_group' in tags:
-                duplicate_groups.append((text, k))
+        for k in self._group_children:
+            _, text_lower, is_duplicate = self._group_info[k]
+            if is_duplicate:
+                duplicate_groups.append((text_lower, k))
             else:
-                unique_groups.append((text, k))
+                unique_groups.append((text_lower, k))
 
         # Sort each section alphabetically by name
-        duplicate_groups.sort(key=lambda t: t[0].lower(), reverse=reverse)
-        unique_groups.sort(key=lambda t: t[0].lower(), reverse=reverse)
+        duplicate_groups.sort(key=lambda t: t[0], reverse=reverse)
+        unique_groups.sort(key=lambda t: t[0], reverse=reverse)
 
         # Combine: duplicates first, then uniques
         all_groups = duplicate_groups + unique_groups
 
-        # Rearrange groups in the tree
-        for index, (val, k) in enumerate(all_groups):
-            self.tree.move(k, '', index)
-
-            # Sort children within each group
-            children = list(self.tree.get_children(k))
+        # Sort children within each group, collecting the new order of every
+        # group whose children moved so the tree is rearranged in one script
+        tree = str(self.tree)
+        reorder = [f"{tree} children {{}} {{{' '.join(k for _, k in all_groups)}}}"]
+        group_children = {}
+        for val, k in all_groups:
+            children = list(self._group_children[k])
 
             # Sort by priority first (marked=0, unmarked=1), then by text
             # When reverse is True, we want text reversed but marked items still on top
             if reverse:
                 # Separate marked and unmarked items
-                marked = [c for c in children if 'to_remove' in self.tree.item(c, 'tags') or 'base' in self.tree.item(c, 'tags')]
-                unmarked = [c for c in children if c not in marked]
+                marked = [c for c in children if is_marked(c)]
+                unmarked = [c for c in children if not is_marked(c)]
 
                 # Sort each subgroup by text in reverse order
                 marked.sort(key=get_sort_text, reverse=True)
@@ -450,8 +714,11 @@ class FileListMixin:
                 # Normal sort: marked first, then alphabetically
                 children.sort(key=get_child_sort_key)
 
-            for c_index, c_id in enumerate(children):
-                self.tree.move(c_id, k, c_index)
+            if children != self._group_children[k]:
+                reorder.append(f"{tree} children {k} {{{' '.join(children)}}}")
+            group_children[k] = children
+        self.tree.tk.eval('\n'.join(reorder))
+        self._group_children = group_children
 
         # Update sort state
         self.sort_column = col
@@ -484,32 +751,18 @@ class FileListMixin:
         progress indication, and proper cleanup of the UI afterward.
         """
         selected = self.tree.selection()
-        file_items = [item for item in selected if self.tree.parent(item)]
+        file_items = [item for item in selected if item in self._item_parents]
         if not file_items:
             # If nothing selected, use all marked items
-            for item in self.tree.tag_has('to_remove'):
-                file_items.append(item)
+            file_items = list(self._to_remove_items)
 
         orphaned_images = []
         if self.scan_images.get():
             # Calculate which images will become orphaned after deletion
-            all_files = []
-            for paths in self.duplicates.values():
-                all_files.extend(paths)
-            for paths in self.non_duplicates.values():
-                all_files.extend(paths)
-
-            files_to_delete_paths = set()
-            for item in file_items:
-                values = self.tree.item(item, 'values')
-                if values:
-                    files_to_delete_paths.add(values[0])
-
-            keep_filenames = set()
-            for path in all_files:
-                if path not in files_to_delete_paths:
-                    keep_filenames.add(os.path.splitext(os.path.basename(path))[0].lower())
+            item_paths = self._item_paths
+            files_to_delete_paths = {item_paths[item] for item in file_items if item in item_paths}
 
+            keep_filenames = self.get_keep_filenames(files_to_delete_paths)
             orphaned_images = self.get_orphaned_images(keep_filenames)
 
         if not file_items and not orphaned_images:
@@ -531,6 +784,25 @@ class FileListMixin:
         messagebox.showinfo("Done", f"Deleted {deleted_count} item(s)")
         self.scan()
 
+    def _remove_file_item(self, item: str) -> str:
+        """Remove a file item from the tree and from the Python-side stores.
+
+        Args:
+            item: Tree item ID of the file
+
+        Returns:
+            Item ID of the group the file belonged to
+        """
+        parent = self._item_parents.pop(item)
+        self._group_children[parent].remove(item)
+        self.tree.delete(item)
+        self._to_remove_items.discard(item)
+        del self._item_paths[item]
+        del self._item_tags[item]
+        del self._item_sort_text[item]
+        self._filter_corpus = {}
+        return parent
+
     def _confirm_deletion(self, file_items: List[str], orphaned_images: List[str], is_perm: bool) -> bool:
         """Show confirmation dialog for file deletion.
 
@@ -597,72 +869,82 @@ class FileListMixin:
         pb['value'] = 0
 
         deleted_count = 0
-        parents_to_check = set()
+        # Paths deleted from each group, removed from the results once per group
+        deleted_paths: Dict[str, Set[str]] = {}
+        # Permanent deletes unlink names relative to their open directory
+        use_dir_fd = is_perm and _UNLINK_DIR_FD
+        dir_fds: Dict[str, Optional[int]] = {}
 
         try:
-            # Delete regular files
-            for i, item in enumerate(file_items):
-                values = self.tree.item(item, 'values')
-                if values:
-                    path = values[0]
-                    filename = os.path.basename(path)
-                    display_name = filename[:57] + "..." if len(filename) > 60 else filename
-                    lbl.config(text=f"Deleting: {display_name}")
-                    pb['value'] = i + 1
-                    progress_popup.update()
-
-                    path = path.replace('/', os.sep)
-                    if path and os.path.exists(path):
+            # Trash backends choose destination names without locking, so
+            # same-named files must not be trashed concurrently
+            workers = DELETE_WORKERS if is_perm else 1
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                def submit(path: str, skip_missing: bool) -> Any:
+                    """Queue the deletion of a scanned path."""
+                    native_path, dir_fd = path.replace('/', os.sep), None
+                    if use_dir_fd:
+                        native_path, dir_fd = _split_dir_fd(native_path, dir_fds)
+                    return executor.submit(_delete_file, native_path, is_perm, skip_missing, dir_fd)
+
+                pending = {}
+                for item in file_items:
+                    path = self._item_paths.get(item)
+                    if path:
+                        pending[submit(path, True)] = (item, path)
+                for path in orphaned_images:
+                    pending[submit(path, False)] = (None, path)
+
+                completed = 0
+                while pending:
+                    # Block for a full tick (or until everything is done) so
+                    # fast deletions don't wake the UI once per file
+                    done, _ = wait(pending, timeout=DELETE_REFRESH_MS / 1000)
+                    last_deleted = None
+                    for future in done:
+                        item, path = pending.pop(future)
+                        completed += 1
                         try:
-                            if is_perm:
-                                os.remove(path)
-                            else:
-                                send2trash(path)
-                            deleted_count += 1
-
-                            # Track UI cleanup needed
-                            parent = self.tree.parent(item)
-                            parents_to_check.add(parent)
-                            self.tree.delete(item)
-
-                            # Update data structures
-                            parent_text = self.tree.item(parent, 'text')
-                            normalized_path = path.replace(os.sep, '/')
-                            if parent_text in self.duplicates:
-                                if normalized_path in self.duplicates[parent_text]:
-                                    self.duplicates[parent_text].remove(normalized_path)
-                            elif parent_text in self.non_duplicates:
-                                if normalized_path in self.non_duplicates[parent_text]:
-                                    self.non_duplicates[parent_text].remove(normalized_path)
+                            if not future.result():
+                                continue  # Already gone
                         except Exception as e:
                             messagebox.showerror("Error", f"Failed to delete {path}: {str(e)}")
-
-            # Delete orphaned images
-            start_idx = len(file_items)
-            for i, path in enumerate(orphaned_images):
-                filename = os.path.basename(path)
-                display_name = filename[:57] + "..." if len(filename) > 60 else filename
-                lbl.config(text=f"Deleting Image: {display_name}")
-                pb['value'] = start_idx + i + 1
-                progress_popup.update()
-
-                try:
-                    p = path.replace('/', os.sep)
-                    if is_perm:
-                        os.remove(p)
-                    else:
-                        send2trash(p)
-                    deleted_count += 1
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to delete {path}: {str(e)}")
+                            continue
+                        deleted_count += 1
+                        last_deleted = (item, path)
+                        if item is None:
+                            continue
+
+                        # Track UI cleanup needed
+                        parent = self._remove_file_item(item)
+                        deleted_paths.setdefault(parent, set()).add(path)
+
+                    # Redraw once per tick rather than once per file
+                    if last_deleted:
+                        item, path = last_deleted
+                        filename = os.path.basename(path)
+                        display_name = filename[:57] + "..." if len(filename) > 60 else filename
+                        prefix = "Deleting Image" if item is None else "Deleting"
+                        lbl.config(text=f"{prefix}: {display_name}")
+                    pb['value'] = completed
+                    progress_popup.update()
 
         finally:
+            # All tasks have finished once the executor has shut down
+            for dir_fd in dir_fds.values():
+                if dir_fd is not None:
+                    os.close(dir_fd)
             progress_popup.destroy()
 
-        # Clean up empty parent groups
-        for parent in parents_to_check:
-            children = self.tree.get_children(parent)
-            parent_text = self.tree.item(parent, 'text')
+        # Update the results and clean up empty parent groups
+        for parent, removed in deleted_paths.items():
+            children = self._group_children[parent]
+            parent_text = self._group_info[parent][0]
+            for groups in (self.duplicates, self.non_duplicates):
+                paths = groups.get(parent_text)
+                if paths is not None:
+                    paths[:] = [p for p in paths if p not in removed]
+                    break
 
             if not children:
                 # Remove empty groups
@@ -671,11 +953,19 @@ class FileListMixin:
                 if parent_text in self.non_duplicates:
                     del self.non_duplicates[parent_text]
                 self.tree.delete(parent)
+                del self._group_info[parent]
+                del self._group_children[parent]
+                del self._item_tags[parent]
             elif len(children) == 1 and parent_text in self.duplicates:
                 # Convert single-item duplicate groups to unique groups
-                child_path = self.tree.item(children[0], 'values')[0]
+                child_path = self._item_paths[children[0]]
                 self.non_duplicates[parent_text] = [child_path]
                 del self.duplicates[parent_text]
                 self.tree.item(parent, open=False, tags=('unique_group',))
+                self._item_tags[parent] = ('unique_group',)
+                self._group_info[parent] = (parent_text, parent_text.lower(), False)
+
+        # Cached names, sizes and image listings no longer match the results
+        self._reset_scan_caches()
 
         return deleted_count
@@ -28,12 +28,7 @@ class ThemeMixin:
         is_dark = theme_name in self.DARK_THEMES
         self.dark_mode_enabled.set(is_dark)
 
-        # Update all theme-dependent elements
-        self._update_theme_colors()
-        self._apply_legacy_widget_theme()
-        self.update_tag_colors()
-        self.apply_display_settings()
-        self._update_menu_theme()
+        self._apply_theme()
         self.save_settings()
 
     def toggle_dark_mode(self) -> None:
@@ -66,32 +61,42 @@ class ThemeMixin:
         self.selection_bg = colors.info
         self.selection_fg = colors.selectfg
 
-    def apply_dark_mode(self) -> None:
-        """Apply dark theme styling (uses current theme, just updates widgets)."""
+    def _apply_theme(self) -> None:
+        """Update all theme-dependent elements for the current ttkbootstrap theme.
+
+        Each step runs once: colors are read, legacy widgets are walked,
+        tag styles and row stripes are configured, then the menu bar is
+        recolored.
+        """
         self._update_theme_colors()
         self._apply_legacy_widget_theme()
+        self._tag_colors_dirty = True
         self.update_tag_colors()
         self.apply_display_settings()
         self._update_menu_theme()
 
+    def apply_dark_mode(self) -> None:
+        """Apply dark theme styling (uses current theme, just updates widgets)."""
+        self._apply_theme()
+
     def apply_light_mode(self) -> None:
         """Apply light theme styling (uses current theme, just updates widgets)."""
-        self._update_theme_colors()
-        self._apply_legacy_widget_theme()
-        self.update_tag_colors()
-        self.apply_display_settings()
-        self._update_menu_theme()
+        self._apply_theme()
 
     def _apply_legacy_widget_theme(self) -> None:
         """Apply theme to legacy tk widgets (Entry, Button, Checkbutton, etc.)."""
         colors = self.style.colors
         is_dark = self.dark_mode_enabled.get()
 
-        for widget in self.winfo_children():
-            self._apply_legacy_widget_theme_recursive(widget, colors, is_dark)
+        # Walk the widget tree with an explicit stack rather than recursion
+        stack = list(self.winfo_children())
+        while stack:
+            widget = stack.pop()
+            self._apply_legacy_widget_style(widget, colors, is_dark)
+            stack.extend(widget.winfo_children())
 
-    def _apply_legacy_widget_theme_recursive(self, widget: tk.Misc, colors: Any, is_dark: bool) -> None:
-        """Recursively apply theme styling to legacy widgets."""
+    def _apply_legacy_widget_style(self, widget: tk.Misc, colors: Any, is_dark: bool) -> None:
+        """Apply theme styling to a single legacy widget (children are not visited)."""
         widget_type = widget.winfo_class()
         w: Any = widget
 
@@ -130,9 +135,6 @@ class ThemeMixin:
         except tk.TclError:
             pass  # Some widgets may not support all properties
 
-        for child in widget.winfo_children():
-            self._apply_legacy_widget_theme_recursive(child, colors, is_dark)
-
     def _update_menu_theme(self) -> None:
         """Update menu bar theme colors based on current theme."""
         if not hasattr(self, 'menu_bar_frame'):
@@ -157,7 +159,13 @@ class ThemeMixin:
             self._fully_close_menu()
 
     def update_tag_colors(self) -> None:
-        """Update treeview tag colors based on current theme."""
+        """Update treeview tag colors based on current theme.
+
+        Tag styles only depend on the theme, so this does nothing unless the
+        theme changed since the last call (see _tag_colors_dirty).
+        """
+        if not self._tag_colors_dirty:
+            return
         is_dark = self.dark_mode_enabled.get()
         colors = self.style.colors
 
@@ -179,6 +187,7 @@ class ThemeMixin:
             self.tree.tag_configure('group', background=colors.dark, foreground=colors.fg)
         else:
             self.tree.tag_configure('group', background=colors.light, foreground=colors.fg)
+        self._tag_colors_dirty = False
 
     def toggle_row_colors(self) -> None:
         """Toggle alternating row colors and save preference."""
@@ -212,24 +221,29 @@ class ThemeMixin:
             return
 
         row_index = 0
-        for item in self.tree.get_children():
+        changes = []
+        for item, children in self._group_children.items():
             # Apply alternating colors
             tag = 'evenrow' if row_index % 2 == 0 else 'oddrow'
 
             # Get existing tags and add row color
-            current_tags = list(self.tree.item(item, 'tags'))
+            old_tags = self._item_tags.get(item, ())
             # Remove old row tags
-            current_tags = [t for t in current_tags if t not in ('oddrow', 'evenrow')]
-            current_tags.append(tag)
-            self.tree.item(item, tags=current_tags)
+            current_tags = tuple(t for t in old_tags if t not in ('oddrow', 'evenrow')) + (tag,)
+            if current_tags != old_tags:
+                changes.append((item, current_tags))
 
             row_index += 1
 
             # Process children (file items in groups)
-            for child in self.tree.get_children(item):
+            for child in children:
                 tag = 'evenrow' if row_index % 2 == 0 else 'oddrow'
-                child_tags = list(self.tree.item(child, 'tags'))
-                child_tags = [t for t in child_tags if t not in ('oddrow', 'evenrow')]
-                child_tags.append(tag)
-                self.tree.item(child, tags=child_tags)
+                old_tags = self._item_tags.get(child, ())
+                child_tags = tuple(t for t in old_tags if t not in ('oddrow', 'evenrow')) + (tag,)
+                # Skip the write when the row already has the right stripe
+                if child_tags != old_tags:
+                    changes.append((child, child_tags))
                 row_index += 1
+
+        # Write all changed rows in one Tcl call
+        self._set_tags_batch(changes)
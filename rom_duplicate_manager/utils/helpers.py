@@ -2,10 +2,85 @@
 
 import os
 import re
-import math
 import hashlib
+import functools
+import threading
 from typing import Set, Tuple, Optional, Dict, List, Callable, Any
 
+# Prefer xxHash (XXH3) or BLAKE3 for partial hashing when the optional
+# package is installed; the hash is only a content fingerprint
+try:
+    from xxhash import xxh3_128 as _new_hasher
+    _HASH_ALGORITHM = "xxh3-128"
+except ImportError:
+    try:
+        from blake3 import blake3 as _new_hasher
+        _HASH_ALGORITHM = "blake3"
+    except ImportError:
+        _new_hasher = functools.partial(hashlib.blake2b, digest_size=16)
+        _HASH_ALGORITHM = "blake2b-16"
+
+# Partial hash sampling size (256KB per sample point)
+PARTIAL_HASH_CHUNK_SIZE = 262144
+
+# Middle and end samples start on a multiple of this (filesystem block size)
+PARTIAL_HASH_ALIGNMENT = 4096
+
+# Files up to this size are hashed in full rather than sampled
+PARTIAL_HASH_FULL_LIMIT = PARTIAL_HASH_CHUNK_SIZE * 3
+
+# Identifies the hash algorithm and sampling layout (invalidates cached hashes)
+PARTIAL_HASH_SCHEME = (
+    f"{_HASH_ALGORITHM}:{PARTIAL_HASH_CHUNK_SIZE}:{PARTIAL_HASH_ALIGNMENT}:{PARTIAL_HASH_FULL_LIMIT}"
+)
+
+# Per-thread read buffer reused across get_partial_hash calls
+_hash_buffers = threading.local()
+
+# Entries kept by the per-name caches (duplicate names recur across folders)
+_NAME_CACHE_SIZE = 65536
+
+# Precompiled filename patterns
+_RE_PREFIX_DIGITS = re.compile(r'^\d{3,4}\s+')
+# Trailing run of " - Copy" markers; only the last one may carry a "(n)"
+_RE_COPY = re.compile(r'(?:\s*-\s*Copy)*\s*-\s*Copy(?:\s*\(\d+\))?$', re.IGNORECASE)
+_RE_PAREN_TAIL = re.compile(r'\s*[\(\[].*?[\)\]]$')
+_RE_ANY_DIGIT = re.compile(r'\d')
+_RE_DATE_SEP = re.compile(r'(20\d{2}|19\d{2})[.\-_](\d{1,2})[.\-_](\d{1,2})')
+_RE_DATE_COMPACT = re.compile(r'(?<!\d)(20\d{2}|19\d{2})(\d{2})(\d{2})(?!\d)')
+_RE_VERSION = re.compile(r'v(?:er(?:sion)?)?[\s\-_]?(\d+(?:\.\d+)*)', re.IGNORECASE)
+_RE_PROTO = re.compile(r'\((?:proto|beta)\s*(\d+)\)')
+_RE_PAREN_NUM = re.compile(r'\((\d+)\)')
+_RE_TRAIL_NUM = re.compile(r'[_\s\-](\d+(?:\.\d+)*)$')
+_RE_PAREN_ANY = re.compile(r'\(([^)]+)\)')
+
+# Language, region and video format identifiers found in parentheses
+_LANG_TABLE = {
+    # Languages
+    'en': 'English', 'english': 'English',
+    'ja': 'Japanese', 'japan': 'Japanese',
+    'fr': 'French', 'france': 'French',
+    'de': 'German', 'germany': 'German',
+    'es': 'Spanish', 'spain': 'Spanish',
+    'it': 'Italian', 'italy': 'Italian',
+    'nl': 'Dutch', 'netherlands': 'Dutch',
+    'pt': 'Portuguese', 'portugal': 'Portuguese',
+    'sv': 'Swedish', 'sweden': 'Swedish',
+    'zh': 'Chinese', 'taiwan': 'Chinese', 'china': 'Chinese',
+    'ko': 'Korean', 'korea': 'Korean',
+    # Regions
+    'usa': 'English-US', 'europe': 'English-EU', 'australia': 'English-EU',
+    'uk': 'English-EU', 'world': 'World', 'global': 'World',
+    # Video formats
+    'ntsc': 'NTSC', 'pal': 'PAL', 'secam': 'SECAM',
+}
+
+# Whole comma/whitespace-separated tokens that appear in _LANG_TABLE
+_RE_LANG_TOKEN = re.compile(
+    r'(?<![^,\s])(?:'
+    + '|'.join(map(re.escape, sorted(_LANG_TABLE, key=len, reverse=True)))
+    + r')(?![^,\s])')
+
 
 def normalize_filename(filename: str, system_extensions: Optional[Set[str]] = None,
                        ignore_system_prefix: bool = False) -> str:
@@ -16,6 +91,9 @@ def normalize_filename(filename: str, system_extensions: Optional[Set[str]] = No
     prefixes from ROM filenames when wildcard scanning is enabled to align
     numbered system files with unnumbered archives.
 
+    >>> normalize_filename("Foo (USA) (Rev A) - Copy (2).zip")
+    'Foo'
+
     Args:
         filename: The filename to normalize
         system_extensions: Set of ROM/system extensions to check for catalog prefixes
@@ -26,18 +104,31 @@ def normalize_filename(filename: str, system_extensions: Optional[Set[str]] = No
     """
     name, ext = os.path.splitext(filename)
     if ignore_system_prefix and system_extensions and ext.lower() in system_extensions:
-        name = re.sub(r'^\d{3,4}\s+', '', name)
-
-    while True:
-        old_name = name
-        name = re.sub(r'\s*-\s*Copy(?:\s*\(\d+\))?$', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s*[\(\[].*?[\)\]]$', '', name)
-        name = name.strip()
-        if name == old_name:
-            break
-    return name
+        name = _RE_PREFIX_DIGITS.sub('', name)
+    return _strip_name_suffixes(name)
+
+
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _strip_name_suffixes(name: str) -> str:
+    """Remove copy markers and trailing bracketed tags from a name (cached).
+
+    Args:
+        name: Filename without extension
 
+    Returns:
+        Name without the suffixes, stripped of surrounding whitespace
+    """
+    # Copy markers are peeled until one ending in "(n)" is exposed, at which
+    # point the bracket pattern drops everything from the first opening
+    # bracket. Nothing bracketed survives that, so a final copy pass is
+    # enough to reach the same result as repeating both until stable.
+    name = _RE_COPY.sub('', name.strip())
+    name = _RE_PAREN_TAIL.sub('', name)
+    name = _RE_COPY.sub('', name)
+    return name.strip()
 
+
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
 def extract_version(filename: str) -> Tuple[int, ...]:
     """Extract version information from filename for comparison.
 
@@ -56,19 +147,27 @@ def extract_version(filename: str) -> Tuple[int, ...]:
     Returns:
         Tuple of version components for comparison (higher values = newer)
     """
+    # Every version pattern needs a digit; most ROM names have none
+    if not _RE_ANY_DIGIT.search(filename):
+        return (0, 0, 0, 0, 0, 0)
+
     filename_lower = filename.lower()
     name_no_ext, _ = os.path.splitext(filename)
 
+    # Each search below is skipped when a substring its pattern requires is
+    # missing, so a typical name only pays for the patterns that can match
+
     # Extract dates in various formats
     date_val = (0, 0, 0)
-    date_match = re.search(r'(20\d{2}|19\d{2})[.\-_](\d{1,2})[.\-_](\d{1,2})', name_no_ext)
+    has_century = '19' in name_no_ext or '20' in name_no_ext
+    date_match = _RE_DATE_SEP.search(name_no_ext) if has_century else None
     if date_match:
         try:
             date_val = tuple(map(int, date_match.groups()))
         except ValueError:
             pass
-    else:
-        date_match = re.search(r'(?<!\d)(20\d{2}|19\d{2})(\d{2})(\d{2})(?!\d)', name_no_ext)
+    elif has_century:
+        date_match = _RE_DATE_COMPACT.search(name_no_ext)
         if date_match:
             try:
                 date_val = tuple(map(int, date_match.groups()))
@@ -77,7 +176,7 @@ def extract_version(filename: str) -> Tuple[int, ...]:
 
     # Extract explicit version numbers
     v_val = (0,)
-    v_matches = re.findall(r'v(?:er(?:sion)?)?[\s\-_]?(\d+(?:\.\d+)*)', name_no_ext, re.IGNORECASE)
+    v_matches = _RE_VERSION.findall(name_no_ext) if 'v' in filename_lower else None
     if v_matches:
         try:
             v_val = tuple(map(int, v_matches[-1].split('.')))
@@ -85,7 +184,9 @@ def extract_version(filename: str) -> Tuple[int, ...]:
             pass
     # Extract proto/beta version indicators
     proto_val = (0,)
-    proto_match = re.search(r'\((?:proto|beta)\s*(\d+)\)', filename_lower)
+    proto_match = None
+    if 'proto' in filename_lower or 'beta' in filename_lower:
+        proto_match = _RE_PROTO.search(filename_lower)
     if proto_match:
         try:
             proto_val = (int(proto_match.group(1)),)
@@ -94,14 +195,14 @@ def extract_version(filename: str) -> Tuple[int, ...]:
 
     # Extract other numeric indicators
     other_val = (0,)
-    p_match = re.search(r'\((\d+)\)', name_no_ext)
+    p_match = _RE_PAREN_NUM.search(name_no_ext) if '(' in name_no_ext else None
     if p_match:
         try:
             other_val = (int(p_match.group(1)),)
         except ValueError:
             pass
     else:
-        t_match = re.search(r'[_\s\-](\d+(?:\.\d+)*)$', name_no_ext)
+        t_match = _RE_TRAIL_NUM.search(name_no_ext)
         if t_match:
             try:
                 other_val = tuple(map(int, t_match.group(1).split('.')))
@@ -125,91 +226,121 @@ def extract_languages(filename: str) -> Set[str]:
     """
     languages = set()
 
-    # Language and region mappings
-    lang_map = {
-        'en': 'English', 'english': 'English',
-        'ja': 'Japanese', 'japan': 'Japanese',
-        'fr': 'French', 'france': 'French',
-        'de': 'German', 'germany': 'German',
-        'es': 'Spanish', 'spain': 'Spanish',
-        'it': 'Italian', 'italy': 'Italian',
-        'nl': 'Dutch', 'netherlands': 'Dutch',
-        'pt': 'Portuguese', 'portugal': 'Portuguese',
-        'sv': 'Swedish', 'sweden': 'Swedish',
-        'zh': 'Chinese', 'taiwan': 'Chinese', 'china': 'Chinese',
-        'ko': 'Korean', 'korea': 'Korean'
-    }
-
-    region_map = {
-        'usa': 'English-US', 'europe': 'English-EU', 'australia': 'English-EU',
-        'uk': 'English-EU', 'world': 'World', 'global': 'World'
-    }
-
-    format_map = {'ntsc': 'NTSC', 'pal': 'PAL', 'secam': 'SECAM'}
+    # Extract language information from parentheses (lowercased once up front)
+    if '(' in filename:
+        for match in _RE_PAREN_ANY.findall(filename.lower()):
+            for token in _RE_LANG_TOKEN.findall(match):
+                languages.add(_LANG_TABLE[token])
 
-    filename_lower = filename.lower()
+    return languages if languages else {'Unknown'}
 
-    # Extract language information from parentheses
-    paren_matches = re.findall(r'\(([^)]+)\)', filename)
-    for match in paren_matches:
-        parts = re.split(r'[,\s]+', match.lower())
-        for part in parts:
-            part = part.strip()
-            if part in lang_map:
-                languages.add(lang_map[part])
-            elif part in region_map:
-                languages.add(region_map[part])
-            elif part in format_map:
-                languages.add(format_map[part])
 
-    return languages if languages else {'Unknown'}
+def _get_hash_buffer() -> memoryview:
+    """Get this thread's reusable read buffer for partial hashing.
+
+    Returns:
+        Writable memoryview over a bytearray that holds one sample plus the
+        slack an aligned end sample may need
+    """
+    buffer = getattr(_hash_buffers, 'view', None)
+    if buffer is None:
+        buffer = memoryview(bytearray(PARTIAL_HASH_CHUNK_SIZE + PARTIAL_HASH_ALIGNMENT))
+        _hash_buffers.view = buffer
+    return buffer
 
 
-def get_partial_hash(filepath: str) -> Optional[str]:
+def _read_full(f: Any, view: memoryview) -> int:
+    """Fill a buffer from an unbuffered file, stopping early only at EOF.
+
+    A raw read may return fewer bytes than requested (network and FUSE
+    filesystems do this), so reads are repeated until the buffer is full.
+
+    Args:
+        f: File opened in binary mode with buffering=0
+        view: Writable memoryview to fill
+
+    Returns:
+        Number of bytes read
+    """
+    got = 0
+    total = len(view)
+    while got < total:
+        n = f.readinto(view[got:])
+        if not n:
+            break
+        got += n
+    return got
+
+
+def get_partial_hash(filepath: str, size: Optional[int] = None) -> Optional[str]:
     """Generate a fast partial hash for file content comparison.
 
-    Uses a three-point sampling strategy for optimal balance between speed
-    and accuracy:
-    - First 128KB (header/metadata)
-    - Middle 128KB (content sample)
-    - Last 128KB (footer/trailer)
+    Files up to PARTIAL_HASH_FULL_LIMIT (768KB) are hashed in full, so
+    every byte of common ROM sizes is compared. Larger files use a
+    three-point sampling strategy for optimal balance between speed and
+    accuracy:
+    - First 256KB (header/metadata)
+    - Middle 256KB (content sample)
+    - Last 256KB (footer/trailer)
+
+    Above the limit, the middle and end samples start on a
+    PARTIAL_HASH_ALIGNMENT boundary, so the end sample runs from there to
+    the end of the file (up to one block longer); just past the limit the
+    three samples still cover every byte. Files are read unbuffered, since
+    every read is a large one; each sample, and each chunk of a full-file
+    read, is read until full or EOF.
 
     This catches differences in file structure while keeping hash time minimal
-    even for multi-GB files.
+    even for multi-GB files. Samples are read into a reusable per-thread
+    buffer and hashed with XXH3 or BLAKE3 if available, otherwise BLAKE2b;
+    all are faster than MD5 in software.
 
     Args:
         filepath: Path to the file to hash
+        size: File size in bytes if already known (avoids an extra stat call)
 
     Returns:
         Hex digest of partial hash, "empty" for zero-byte files, or None on error
     """
     try:
-        size = os.path.getsize(filepath)
+        if size is None:
+            size = os.path.getsize(filepath)
         if size == 0:
             return "empty"
 
-        chunk_size = 131072  # 128KB chunks for better sampling
-        hasher = hashlib.md5()
+        chunk_size = PARTIAL_HASH_CHUNK_SIZE
+        align_mask = ~(PARTIAL_HASH_ALIGNMENT - 1)
+        buffer = _get_hash_buffer()
+        chunk = buffer[:chunk_size]
+        hasher = _new_hasher()
 
-        with open(filepath, "rb") as f:
+        with open(filepath, "rb", buffering=0) as f:
             # Read first chunk
-            hasher.update(f.read(chunk_size))
-
-            # For larger files, add middle and end chunks
-            if size > chunk_size * 2:
+            n = _read_full(f, chunk)
+            hasher.update(buffer[:n])
+
+            if size <= PARTIAL_HASH_FULL_LIMIT:
+                # Small enough to hash the rest of the file as well
+                while n == chunk_size:
+                    n = _read_full(f, chunk)
+                    hasher.update(buffer[:n])
+            else:
+                # For larger files, add middle and end chunks
                 try:
                     # Read middle chunk
-                    f.seek(size // 2 - chunk_size // 2)
-                    hasher.update(f.read(chunk_size))
-
-                    # Read end chunk
-                    f.seek(-chunk_size, os.SEEK_END)
-                    hasher.update(f.read(chunk_size))
+                    f.seek((size // 2 - chunk_size // 2) & align_mask)
+                    n = _read_full(f, chunk)
+                    hasher.update(buffer[:n])
+
+                    # Read end chunk (through to the end of the file)
+                    f.seek((size - chunk_size) & align_mask)
+                    n = _read_full(f, buffer)
+                    hasher.update(buffer[:n])
                 except OSError:
                     pass  # Handle files that can't seek
 
         return hasher.hexdigest()
-    except Exception:
+    except OSError:
         return None
 
 
@@ -225,8 +356,8 @@ def format_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = int(math.floor(math.log(size_bytes, 1024)))
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
+    size_names = ("B", "KB", "MB", "GB", "TB")
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    i = min((size_bytes.bit_length() - 1) // 10, len(size_names) - 1)
+    s = round(size_bytes / (1 << (i * 10)), 2)
     return f"{s} {size_names[i]}"
\ No newline at end of file
@@ -1,22 +1,23 @@
 """Icon handling utilities for ROM Duplicate Manager."""
 
-import base64
 import tkinter as tk
 from typing import Optional
 
 # Application icon data
-PACMAN_ICON_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABq0lEQVR4nO2bYZKDIAyFkzdcpvc/TI/DjrvT3Z1WBSQJifD9q6LvvQwgxZFosVgsFvPClmL5Sbm2LT9svLGn0COKwV5DWxWDowTXKgQoYHhJPUQML6nLow2MHhK4Q/geP7AU0+aKL1iIWNLqL2kZ4cfnsfwkd0Cjunvhz44PXXKT8E23kDn/NWXmYT2h5skAzfDf1779frWzoMY3pMRaQ1kVobsA2fms3+sf0oLvY35vDrCkNA8kFdHBoVuWxulO3f8o9Jbj6BxLFqBlYpN8FPbsDSQ5Gz+haoogEV59QyRf7P6lcL3ht+BXwh/lSX12DsXE/wtobYwmUsJTNz/VIIdPAKt3Aqo9wHNoVwXgQcF/9cnREBhRDJAjtqJbFx7kkFchJIthug6Q5L9xjSECCoTGEOGSIDmnt1eAglMzX5ydA92IK0OEa25KgSkNEdDNMd8UjQa8r9V7mX4IlECxReBeIPZuMGIRav1C46ajafEJmhy0XuC9F7T6g4WIFVd8wVJMk6t+WEI88hY6PJgYqQsZK/ZFkNJjUmDa7wX2mPKLkUjfDC0WiwXNzBcIwbWZE7SXrAAAAABJRU5ErkJggg=="
+PACMAN_ICON_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAEAAAABAAgMAAADXB5lNAAAADFBMVEUAAAAAAAD/1wD////qRhkBAAAAAXRSTlMAQObYZgAAANRJREFUeNq9k70NhDAMhS0qlCmos49TMAJLkCWup0EKbx/m4Yr8ObboTpcun/Ic/zwT/fFMwDEAAIji7gEAgwCQIpdBUoquKYqucRUkpWiadq+pAGeQYAI+LKM6YOdNRPW4nnsVUT3O5w4CQIBYwM7qBRdwlF8rSLRkcDGvQ15g3nqxDjVTIpoLOEN5MItuJFIgqg6bltP7DN5iZNGshzAAxAwmqLEI0MrvomUcXGuhmqUBXksMcPJflcjxahgFjMeMC41PjZNtn802mH2xG2V37rfnCw5HOmFNTF73AAAAAElFTkSuQmCC"
 
 
 def get_icon_photo() -> Optional[tk.PhotoImage]:
     """Convert base64 icon to tkinter PhotoImage.
 
+    Tk decodes base64 image data natively, so the constant is handed over
+    as-is instead of being decoded into an intermediate bytes copy first.
+
     Returns:
         PhotoImage object or None if loading fails
     """
     try:
-        icon_data = base64.b64decode(PACMAN_ICON_BASE64)
-        return tk.PhotoImage(data=icon_data)
+        return tk.PhotoImage(data=PACMAN_ICON_BASE64)
     except Exception as e:
         print(f"Failed to load icon: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -41,6 +41,9 @@ setup(
     install_requires=[
         'send2trash',
     ],
+    extras_require={
+        'fast-hash': ['xxhash'],
+    },
     entry_points={
         'console_scripts': [
             'rom-duplicate-manager=rom_duplicate_manager:main',
@@ -0,0 +1,44 @@
+"""Tests for rom_duplicate_manager.utils.helpers."""
+
+import os
+import tempfile
+import unittest
+
+from rom_duplicate_manager.utils.helpers import get_partial_hash
+
+
+class PartialHashTest(unittest.TestCase):
+    """Content fingerprinting used by the size-match duplicate check."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self._tmp.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_512kb_files_differing_in_tail_hash_differently(self):
+        size = 512 * 1024
+        data = bytearray(size)
+        first = self._write('a.bin', bytes(data))
+        data[size - 1] = 1
+        second = self._write('b.bin', bytes(data))
+
+        self.assertNotEqual(get_partial_hash(first), get_partial_hash(second))
+
+    def test_identical_files_hash_equal(self):
+        data = os.urandom(512 * 1024)
+        first = self._write('a.bin', data)
+        second = self._write('b.bin', data)
+
+        self.assertEqual(get_partial_hash(first), get_partial_hash(second))
+
+    def test_empty_file(self):
+        self.assertEqual(get_partial_hash(self._write('empty.bin', b'')), 'empty')
+
+
+if __name__ == '__main__':
+    unittest.main()